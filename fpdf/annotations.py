@@ -1,5 +1,7 @@
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import NamedTuple, Tuple, Union
 
 from .actions import Action
@@ -20,6 +22,21 @@ from .syntax import iobj_ref as pdf_ref
 
 # cf. https://docs.verapdf.org/validation/pdfa-part1/#rule-653-2
 DEFAULT_ANNOT_FLAGS = (AnnotationFlag.PRINT,)
+ANNOT_TYPE = Name("Annot")
+# Size of embedded files above which they are hashed in a thread, while being compressed:
+_THREADED_CHECKSUM_MIN_BYTES = 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _interned_name(value):
+    # Documents often contain thousands of annotations of the same few subtypes:
+    # they all share the same immutable Name instances.
+    return Name(value)
+
+
+@lru_cache(maxsize=None)
+def _border(border_width):
+    return f"[0 0 {border_width}]"
 
 
 class AnnotationMixin:
@@ -46,11 +63,11 @@ class AnnotationMixin:
         value=None,
         default_appearance: str = None,  # for free text annotations
     ):
-        self.type = Name("Annot")
-        self.subtype = Name(subtype)
+        self.type = ANNOT_TYPE
+        self.subtype = _interned_name(subtype)
         self.rect = f"[{x:.2f} {y:.2f} {x + width:.2f} {y - height:.2f}]"
-        self.border = f"[0 0 {border_width}]"
-        self.f_t = Name(field_type) if field_type else None
+        self.border = _border(border_width)
+        self.f_t = _interned_name(field_type) if field_type else None
         self.v = value
         self.f = sum(flags)
         self.contents = PDFString(contents, encrypt=True) if contents else None
@@ -107,7 +124,7 @@ class AnnotationDict(AnnotationMixin):
 
     def serialize(self, _security_handler=None, _obj_id=None):
         obj_dict = build_obj_dict(
-            {key: getattr(self, key) for key in dir(self)},
+            {key: getattr(self, key) for key in dir(self) if not key.startswith("_")},
             _security_handler=_security_handler,
             _obj_id=_obj_id,
         )
@@ -131,7 +148,18 @@ class PDFEmbeddedFile(PDFContentStream):
         compress: bool = False,
         checksum: bool = False,
     ):
-        super().__init__(contents=contents, compress=compress)
+        if checksum and compress and len(contents) >= _THREADED_CHECKSUM_MIN_BYTES:
+            # The checksum is computed on the uncompressed file bytes (PDF 32000 Table 46),
+            # which allows to hash them while they are being compressed:
+            # both hashlib & zlib release the GIL on large inputs.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                hash_future = executor.submit(_md5_hexdigest, contents)
+                super().__init__(contents=contents, compress=compress)
+                hash_hex = hash_future.result()
+        else:
+            super().__init__(contents=contents, compress=compress)
+            if checksum:
+                hash_hex = _md5_hexdigest(contents)
         self.type = Name("EmbeddedFile")
         params = {"/Size": len(contents)}
         if creation_date:
@@ -139,9 +167,6 @@ class PDFEmbeddedFile(PDFContentStream):
         if modification_date:
             params["/ModDate"] = PDFDate(modification_date, with_tz=True).serialize()
         if checksum:
-            file_hash = hashlib.new("md5", usedforsecurity=False)
-            file_hash.update(self._contents)
-            hash_hex = file_hash.hexdigest()
             params["/CheckSum"] = f"<{hash_hex}>"
         self.params = pdf_dict(params)
         self._basename = basename  # private so that it does not get serialized
@@ -161,6 +186,10 @@ class PDFEmbeddedFile(PDFContentStream):
         return FileSpec(self, self._basename, self._desc)
 
 
+def _md5_hexdigest(data: bytes) -> str:
+    return hashlib.new("md5", data, usedforsecurity=False).hexdigest()
+
+
 class FileSpec(NamedTuple):
     embedded_file: PDFEmbeddedFile
     basename: str
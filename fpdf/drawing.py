@@ -6,10 +6,11 @@ They may change at any time without prior warning or any deprecation period,
 in non-backward-compatible ways.
 """
 
-import copy, decimal, math, re
+import copy, decimal, io, math, re
 from collections import OrderedDict
 from collections.abc import Sequence
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Optional, NamedTuple, Union
 
 from .enums import (
@@ -108,7 +109,20 @@ def number_to_str(number):
     """
     # this approach tries to produce minimal representations of floating point numbers
     # but can also produce "-0".
-    return f"{number:.4f}".rstrip("0").rstrip(".")
+    if number == 0:
+        return "0"
+    rendered = f"{number:.4f}"
+    if rendered.endswith(".0000"):
+        return rendered[:-5]
+    # at least one decimal is non-zero, so stripping zeros can never leave a bare "."
+    return rendered.rstrip("0")
+
+
+@lru_cache(maxsize=256)
+def _color_operator(components, operator):
+    # Documents usually switch over and over between a handful of colors,
+    # so their operators are only rendered once:
+    return " ".join(number_to_str(val) for val in components) + f" {operator}"
 
 
 # this maybe should live in fpdf.syntax
@@ -223,7 +237,7 @@ class DeviceRGB(
         return tuple(255 * v for v in self.colors)
 
     def serialize(self) -> str:
-        return " ".join(number_to_str(val) for val in self.colors) + f" {self.OPERATOR}"
+        return _color_operator(self.colors, self.OPERATOR)
 
 
 __pdoc__["DeviceRGB.OPERATOR"] = False
@@ -271,7 +285,7 @@ class DeviceGray(
         return tuple(255 * v for v in self.colors)
 
     def serialize(self) -> str:
-        return f"{number_to_str(self.g)} {self.OPERATOR}"
+        return _color_operator((self.g,), self.OPERATOR)
 
 
 __pdoc__["DeviceGray.OPERATOR"] = False
@@ -326,7 +340,7 @@ class DeviceCMYK(
         return self[:-1]
 
     def serialize(self) -> str:
-        return " ".join(number_to_str(val) for val in self.colors) + f" {self.OPERATOR}"
+        return _color_operator(self.colors, self.OPERATOR)
 
 
 __pdoc__["DeviceCMYK.OPERATOR"] = False
@@ -403,6 +417,13 @@ def convert_to_device_color(r, g=-1, b=-1):
         return color_from_hex_string(r)
     if isinstance(r, Sequence):
         r, g, b = r
+    return _device_color_from_8bit(r, g, b)
+
+
+@lru_cache(maxsize=256)
+def _device_color_from_8bit(r, g, b):
+    # Colors are immutable, and documents usually pick them among a small palette,
+    # so each one is only scaled & range-checked once:
     if (r, g, b) == (0, 0, 0) or g == -1:
         return DeviceGray(r / 255)
     return DeviceRGB(r / 255, g / 255, b / 255)
@@ -795,6 +816,8 @@ class Transform(NamedTuple):
 
         The identity transform is a no-op.
         """
+        if cls is Transform:
+            return _IDENTITY_TRANSFORM
         return cls(1, 0, 0, 1, 0, 0)
 
     @classmethod
@@ -809,7 +832,8 @@ class Transform(NamedTuple):
         Returns:
             A Transform representing the specified translation.
         """
-
+        if cls is Transform:
+            return _TranslationTransform(1, 0, 0, 1, x, y)
         return cls(1, 0, 0, 1, x, y)
 
     @classmethod
@@ -829,7 +853,8 @@ class Transform(NamedTuple):
         """
         if y is None:
             y = x
-
+        if cls is Transform:
+            return _ScalingTransform(x, 0, 0, y, 0, 0)
         return cls(x, 0, 0, y, 0, 0)
 
     @classmethod
@@ -845,9 +870,8 @@ class Transform(NamedTuple):
             A Transform representing the specified rotation.
 
         """
-        return cls(
-            math.cos(theta), math.sin(theta), -math.sin(theta), math.cos(theta), 0, 0
-        )
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        return cls(cos_t, sin_t, -sin_t, cos_t, 0, 0)
 
     @classmethod
     def rotation_d(cls, theta_d):
@@ -1076,6 +1100,105 @@ __pdoc__["Transform.e"] = False
 __pdoc__["Transform.f"] = False
 
 
+class _SpecializedTransform(Transform):
+    """
+    Base for the transforms returned by `Transform.identity`, `Transform.translation`
+    and `Transform.scaling`, which compose faster by skipping the terms known to be 0.
+
+    They are equal to the generic `Transform` with the same parameters. The class
+    method constructors, `_make()` and `_replace()` are delegated to `Transform`,
+    so that calling them on an instance cannot produce an incorrectly specialized
+    transform.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def identity(cls):
+        return Transform.identity()
+
+    @classmethod
+    def translation(cls, x, y):
+        return Transform.translation(x, y)
+
+    @classmethod
+    def scaling(cls, x, y=None):
+        return Transform.scaling(x, y)
+
+    @classmethod
+    def rotation(cls, theta):
+        return Transform.rotation(theta)
+
+    @classmethod
+    def shearing(cls, x, y=None):
+        return Transform.shearing(x, y)
+
+    # _make() and _replace() may produce arbitrary parameters,
+    # so they must return a generic Transform:
+    @classmethod
+    def _make(cls, iterable):
+        return Transform._make(iterable)
+
+    def _replace(self, **kwargs):
+        return Transform._make(self)._replace(**kwargs)
+
+    def __repr__(self):
+        return repr(Transform._make(self))
+
+
+class _IdentityTransform(_SpecializedTransform):
+    __slots__ = ()
+
+    def __matmul__(self, other):
+        if isinstance(other, Transform):
+            return other
+
+        return NotImplemented
+
+
+class _TranslationTransform(_SpecializedTransform):
+    __slots__ = ()
+
+    def __matmul__(self, other):
+        if isinstance(other, _TranslationTransform):
+            return _TranslationTransform(1, 0, 0, 1, self.e + other.e, self.f + other.f)
+
+        if isinstance(other, Transform):
+            return Transform(
+                a=other.a,
+                b=other.b,
+                c=other.c,
+                d=other.d,
+                e=self.e * other.a + self.f * other.c + other.e,
+                f=self.e * other.b + self.f * other.d + other.f,
+            )
+
+        return NotImplemented
+
+
+class _ScalingTransform(_SpecializedTransform):
+    __slots__ = ()
+
+    def __matmul__(self, other):
+        if isinstance(other, _ScalingTransform):
+            return _ScalingTransform(self.a * other.a, 0, 0, self.d * other.d, 0, 0)
+
+        if isinstance(other, Transform):
+            return Transform(
+                a=self.a * other.a,
+                b=self.a * other.b,
+                c=self.d * other.c,
+                d=self.d * other.d,
+                e=other.e,
+                f=other.f,
+            )
+
+        return NotImplemented
+
+
+_IDENTITY_TRANSFORM = _IdentityTransform(1, 0, 0, 1, 0, 0)
+
+
 class GraphicsStyle:
     """
     A class representing various style attributes that determine drawing appearance.
@@ -1111,6 +1234,13 @@ class GraphicsStyle:
     )
     """An ordered collection of properties to use when merging two GraphicsStyles."""
 
+    _MERGE_PROPERTIES_SET = frozenset(MERGE_PROPERTIES)
+
+    # The (fill, stroke) color operators already in effect in the graphics state
+    # where a style is being rendered, as emitted by the enclosing GraphicsContexts.
+    # None means unknown. This is rendering state, so it is not copied by `merge`.
+    _emitted_colors = (None, None)
+
     TRANSPARENCY_KEYS = (
         PDFStyleKeys.FILL_ALPHA.value,
         PDFStyleKeys.STROKE_ALPHA.value,
@@ -1181,7 +1311,9 @@ class GraphicsStyle:
         return copied
 
     def __setattr__(self, name, value):
-        if not hasattr(self.__class__, name):
+        # checking the known style names first avoids a lookup through the class MRO
+        # for the common case, as this is called for every style assignment.
+        if name not in self._MERGE_PROPERTIES_SET and not hasattr(self.__class__, name):
             raise AttributeError(
                 f'{self.__class__} does not have style "{name}" (a typo?)'
             )
@@ -1510,16 +1642,22 @@ class GraphicsStyle:
         return rule
 
 
+# These helpers format the coordinates directly rather than going through
+# `Point.render`, to avoid building an intermediate string per point.
 def _render_move(pt):
-    return f"{pt.render()} m"
+    return f"{number_to_str(pt.x)} {number_to_str(pt.y)} m"
 
 
 def _render_line(pt):
-    return f"{pt.render()} l"
+    return f"{number_to_str(pt.x)} {number_to_str(pt.y)} l"
 
 
 def _render_curve(ctrl1, ctrl2, end):
-    return f"{ctrl1.render()} {ctrl2.render()} {end.render()} c"
+    return (
+        f"{number_to_str(ctrl1.x)} {number_to_str(ctrl1.y)} "
+        f"{number_to_str(ctrl2.x)} {number_to_str(ctrl2.y)} "
+        f"{number_to_str(end.x)} {number_to_str(end.y)} c"
+    )
 
 
 class Move(NamedTuple):
@@ -2687,9 +2825,11 @@ class Rectangle(NamedTuple):
         """
         # pylint: disable=unused-argument
 
+        org, size = self.org, self.size
         return (
-            f"{self.org.render()} {self.size.render()} re",
-            Line(self.org),
+            f"{number_to_str(org.x)} {number_to_str(org.y)} "
+            f"{number_to_str(size.x)} {number_to_str(size.y)} re",
+            Line(org),
             initial_point,
         )
 
@@ -3218,6 +3358,19 @@ class DrawingContext:
             A string composed of the PDF representation of all the paths and groups in
             this context (an empty string is returned if there are no paths or groups)
         """
+        # The tree is made of many small fragments: they are accumulated in memory and
+        # written to the debug stream at once, even if rendering fails midway.
+        tree_buffer = io.StringIO()
+        try:
+            return self._render_debug(
+                gsd_registry, first_point, scale, height, starting_style, tree_buffer
+            )
+        finally:
+            debug_stream.write(tree_buffer.getvalue())
+
+    def _render_debug(
+        self, gsd_registry, first_point, scale, height, starting_style, debug_stream
+    ):
         render_list, style, last_item = self._setup_render_prereqs(
             starting_style, first_point, scale, height
         )
@@ -3225,8 +3378,8 @@ class DrawingContext:
         debug_stream.write("ROOT\n")
         for child in self._subitems[:-1]:
             debug_stream.write(" ├─ ")
-            rendered, last_item = child.render_debug(
-                gsd_registry, style, last_item, debug_stream, " │  "
+            rendered, last_item, first_point = child.render_debug(
+                gsd_registry, style, last_item, first_point, debug_stream, " │  "
             )
             if rendered:
                 render_list.append(rendered)
@@ -3471,9 +3624,11 @@ class PaintedPath:
         point. If path elements have been added, this will insert an implicit close in
         order to start a new subpath.
 
-        This will overwrite an absolute move_to as long as no non-move path items have
-        been appended. The relative position is resolved from the previous item when
-        the path is being rendered, or from 0, 0 if it is the first item.
+        As long as no non-move path items have been appended, the offset is added to
+        the pending move: a pending absolute move_to stays absolute, and a pending
+        relative move accumulates the offset. Otherwise, the relative position is
+        resolved from the previous item when the path is being rendered, or from 0, 0
+        if it is the first item.
 
         Args:
             x (Number): abscissa of the (sub)path starting point relative to the.
@@ -3481,10 +3636,13 @@ class PaintedPath:
         """
         self._insert_implicit_close_if_open()
         if self._starter_move is not None:
-            self._closed = False
-            self._graphics_context.add_item(self._starter_move, _copy=False)
-            self._close_context = self._graphics_context
-        self._starter_move = RelativeMove(Point(x, y))
+            # Nothing has been drawn since the pending move, so the offset can be folded
+            # into it rather than emitting a move that would start an empty subpath
+            # (which would in turn require an implicit close).
+            starter = self._starter_move
+            self._starter_move = starter.__class__(starter.pt + Point(x, y))
+        else:
+            self._starter_move = RelativeMove(Point(x, y))
         return self
 
     def line_to(self, x, y):
@@ -3890,6 +4048,10 @@ class ClippingPath(PaintedPath):
             _push_stack=False,
         )
 
+        # the root graphics context of a clipping path is not isolated by a q/Q pair,
+        # so any color it sets leaks into the enclosing context:
+        style._emitted_colors = (None, None)
+
         merged_style = GraphicsStyle.merge(style, self.style)
         # we should never get a collision error here
         intersection_rule = merged_style.intersection_rule
@@ -3985,6 +4147,22 @@ class GraphicsContext:
 
         self.path_items.append(item)
 
+    def add_items(self, items, _copy=True):
+        """
+        Add several path elements to this graphics context at once.
+
+        Args:
+            items: an iterable of path elements, as accepted by `add_item`.
+            _copy (bool): if true (the default), each item will be copied before being
+                appended. This prevents modifications to a referenced object from
+                "retroactively" altering its style/shape and should be disabled with
+                caution.
+        """
+        if _copy:
+            items = [copy.deepcopy(item) for item in items]
+
+        self.path_items.extend(items)
+
     def remove_last_item(self):
         del self.path_items[-1]
 
@@ -4002,6 +4180,7 @@ class GraphicsContext:
         debug_stream=None,
         pfx=None,
         _push_stack=True,
+        _elide_empty_stack=False,
     ):
         """
         Build a list composed of all all the individual elements rendered.
@@ -4024,6 +4203,9 @@ class GraphicsContext:
                 more than one line).
             _push_stack (bool): if True, wrap the resulting render list in a push/pop
                 graphics stack directive pair.
+            _elide_empty_stack (bool): if True, omit the push/pop graphics stack
+                directive pair when this context emits no style, transform or clipping
+                path, as there is then no graphics state to isolate.
 
         Returns:
             `tuple[list[str], last_item]` where `last_item` is the past path element in
@@ -4053,13 +4235,13 @@ class GraphicsContext:
                         styles_dbg.append(f"{attr}: {val}{inh}")
 
                 if styles_dbg:
-                    debug_stream.write(" {\n")
-                    for style_dbg_line in styles_dbg:
-                        debug_stream.write(pfx + "    ")
-                        debug_stream.write(style_dbg_line)
-                        debug_stream.write("\n")
-
-                    debug_stream.write(pfx + "}┐\n")
+                    debug_stream.writelines(
+                        (
+                            " {\n",
+                            *(f"{pfx}    {line}\n" for line in styles_dbg),
+                            pfx + "}┐\n",
+                        )
+                    )
                 else:
                     debug_stream.write("\n")
 
@@ -4094,15 +4276,25 @@ class GraphicsContext:
                 render_list.append(f"{render_pdf_primitive(style_dict_name)} gs")
 
             # we can't set color in the graphics state context dictionary, so we have to
-            # manually inherit it and emit it here.
+            # manually inherit it and emit it here. Colors already set by an enclosing
+            # context are still in effect, so they are not emitted again.
             fill_color = self.style.fill_color
             stroke_color = self.style.stroke_color
+            emitted_fill, emitted_stroke = style._emitted_colors
 
             if fill_color not in NO_EMIT_SET:
-                render_list.append(fill_color.serialize().lower())
+                rendered_fill = fill_color.serialize().lower()
+                if rendered_fill != emitted_fill:
+                    render_list.append(rendered_fill)
+                    emitted_fill = rendered_fill
 
             if stroke_color not in NO_EMIT_SET:
-                render_list.append(stroke_color.serialize().upper())
+                rendered_stroke = stroke_color.serialize().upper()
+                if rendered_stroke != emitted_stroke:
+                    render_list.append(rendered_stroke)
+                    emitted_stroke = rendered_stroke
+
+            merged_style._emitted_colors = (emitted_fill, emitted_stroke)
 
             if emit_dash is not None:
                 render_list.append(
@@ -4110,6 +4302,8 @@ class GraphicsContext:
                     + f" {number_to_str(emit_dash[1])} d"
                 )
 
+            emits_style = bool(render_list)
+
             if debug_stream:
                 if self.clipping_path is not None:
                     debug_stream.write(pfx + " ├─ ")
@@ -4159,19 +4353,26 @@ class GraphicsContext:
                     if rendered_cpath:
                         render_list.append(rendered_cpath)
 
+                # hoisted out of the loop, as paths can have thousands of items:
+                append = render_list.append
                 for item in self.path_items:
                     rendered, last_item, initial_point = item.render(
                         gsd_registry, merged_style, last_item, initial_point
                     )
 
                     if rendered:
-                        render_list.append(rendered)
+                        append(rendered)
 
             # insert transform before points
             if self.transform is not None:
                 render_list.insert(0, self.transform.render(last_item)[0])
 
-            if _push_stack:
+            if _push_stack and (
+                not _elide_empty_stack
+                or emits_style
+                or self.transform is not None
+                or self.clipping_path is not None
+            ):
                 render_list.insert(0, "q")
                 render_list.append("Q")
 
@@ -4195,6 +4396,9 @@ class GraphicsContext:
             debug_stream,
             pfx,
             _push_stack=_push_stack,
+            # PaintedPath relies on the closing "Q" to insert its paint operator, so
+            # only plain groups, rendered from here, can skip an empty push/pop pair:
+            _elide_empty_stack=True,
         )
 
         return " ".join(render_list), last_item, initial_point
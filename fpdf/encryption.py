@@ -8,11 +8,11 @@ in non-backward-compatible ways.
 
 import hashlib
 import logging
-import math
 import stringprep
 import unicodedata
 from binascii import hexlify
 from codecs import BOM_UTF16_BE
+from itertools import islice
 from os import urandom
 from typing import Callable, Iterable, Type, Union
 
@@ -25,13 +25,36 @@ from .syntax import create_dictionary_string as pdf_dict
 try:
     from cryptography.hazmat.primitives.ciphers import Cipher, modes
     from cryptography.hazmat.primitives.ciphers.algorithms import AES128, AES256
-    from cryptography.hazmat.primitives.padding import PKCS7
 
     import_error = None
 except ImportError as error:
     import_error = error
 
 
+def _load_arc4_algorithm():
+    """
+    Returns the cryptography RC4 algorithm class if it can actually be used,
+    or None to fall back to the pure-Python ARC4 class.
+    RC4 may be missing even when cryptography is installed,
+    e.g. when OpenSSL legacy provider is unavailable or in FIPS mode.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from cryptography.exceptions import UnsupportedAlgorithm
+        from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4 as algorithm
+    except ImportError:
+        return None
+    try:
+        Cipher(algorithm(bytes(5)), mode=None).encryptor()
+    except UnsupportedAlgorithm:
+        return None
+    return algorithm
+
+
+# try to use cryptography for RC4 encryption, falling back to the pure-Python ARC4 class
+ARC4Algorithm = _load_arc4_algorithm()
+
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -44,7 +67,8 @@ class ARC4:
     * http://people.csail.mit.edu/rivest/pubs/RS14.pdf
 
     Having this ARC4 implementation makes it possible to have basic
-    encryption functions without additional dependencies
+    encryption functions without additional dependencies.
+    When the `cryptography` package is available, its RC4 implementation is used instead.
     """
 
     MOD = 256
@@ -68,12 +92,15 @@ class ARC4:
             K = S[(S[i] + S[j]) % self.MOD]
             yield K
 
-    def encrypt(self, key: bytes, text: Union[bytes, bytearray]) -> list:
-        keystream = self.PRGA(self.KSA(key))
-        res = []
-        for c in text:
-            res.append(c ^ next(keystream))
-        return res
+    def encrypt(self, key: bytes, text: Union[bytes, bytearray]) -> bytes:
+        if ARC4Algorithm is not None:
+            encryptor = Cipher(ARC4Algorithm(bytes(key)), mode=None).encryptor()
+            return encryptor.update(bytes(text)) + encryptor.finalize()
+        keystream = bytes(islice(self.PRGA(self.KSA(key)), len(text)))
+        # XOR the whole text at once, using Python integers as wide registers:
+        return (
+            int.from_bytes(text, "big") ^ int.from_bytes(keystream, "big")
+        ).to_bytes(len(text), "big")
 
 
 class CryptFilter:
@@ -193,6 +220,7 @@ class StandardSecurityHandler:
         """File_id is the first hash of the PDF file id"""
         self.file_id = file_id
         self.info_id = file_id[1:33]
+        self._object_keys = {}
         if self.revision == 6:
             self.k = self.get_random_bytes(32)
             self.generate_user_password_rev6()
@@ -224,14 +252,14 @@ class StandardSecurityHandler:
         LOGGER.debug("Encrypting string: %s", string)
         try:
             string.encode("latin-1")
-            return f"<{bytes(self.encrypt_bytes(string.encode('latin-1'), obj_id)).hex().upper()}>"
+            return f"<{self.encrypt_bytes(string.encode('latin-1'), obj_id).hex().upper()}>"
         except UnicodeEncodeError:
-            return f'<{hexlify(bytearray(self.encrypt_bytes(BOM_UTF16_BE + string.encode("utf-16-be"), obj_id))).decode("latin-1")}>'
+            return f'<{hexlify(self.encrypt_bytes(BOM_UTF16_BE + string.encode("utf-16-be"), obj_id)).decode("latin-1")}>'
 
     def encrypt_stream(self, stream: bytes, obj_id: int) -> bytes:
         if self.encryption_method == EncryptionMethod.NO_ENCRYPTION:
             return stream
-        return bytes(self.encrypt_bytes(stream, obj_id))
+        return self.encrypt_bytes(stream, obj_id)
 
     def is_aes_algorithm(self) -> bool:
         return self.encryption_method in (
@@ -239,43 +267,53 @@ class StandardSecurityHandler:
             EncryptionMethod.AES_256,
         )
 
-    def encrypt_bytes(self, data: bytes, obj_id: int):
+    def encrypt_bytes(self, data: bytes, obj_id: int) -> bytes:
         """
         PDF32000 reference - Algorithm 1: Encryption of data using the RC4 or AES algorithms
         Append object ID and generation ID to the key and encrypt the data
         Generation ID is fixed as 0. Will need to revisit if the application start changing generation ID
         """
-        h = hashlib.new("md5", usedforsecurity=False)
-        h.update(self.k)
-        h.update(
-            (obj_id & 0xFFFFFF).to_bytes(3, byteorder="little", signed=False)
-        )  # object id
-        h.update(
-            (0 & 0xFFFF).to_bytes(2, byteorder="little", signed=False)
-        )  # generation id
-        if self.is_aes_algorithm():
-            h.update(bytes([0x73, 0x41, 0x6C, 0x54]))  # add salt (sAlT) for AES
-        key = h.digest()
-
+        if self.encryption_method == EncryptionMethod.AES_256:
+            # Revision 6 uses the file encryption key as is, for all objects
+            return self.encrypt_AES_cryptography(self.k, data)
+        key = self.get_object_key(obj_id)
         if self.is_aes_algorithm():
             return self.encrypt_AES_cryptography(key, data)
         return ARC4().encrypt(key, data)
 
+    def get_object_key(self, obj_id: int) -> bytes:
+        """
+        Compute the key used to encrypt the strings & streams of a given object.
+        It is cached, as all the strings of an object share the same key.
+        """
+        key = self._object_keys.get(obj_id)
+        if key is None:
+            h = hashlib.new("md5", usedforsecurity=False)
+            h.update(self.k)
+            h.update(
+                (obj_id & 0xFFFFFF).to_bytes(3, byteorder="little", signed=False)
+            )  # object id
+            h.update(
+                (0 & 0xFFFF).to_bytes(2, byteorder="little", signed=False)
+            )  # generation id
+            if self.is_aes_algorithm():
+                h.update(bytes([0x73, 0x41, 0x6C, 0x54]))  # add salt (sAlT) for AES
+            key = self._object_keys[obj_id] = h.digest()
+        return key
+
     def encrypt_AES_cryptography(self, key: bytes, data: bytes) -> bytes:
         """Encrypts an array of bytes using AES algorithms (AES 128 or AES 256)"""
-        iv = bytearray(self.get_random_bytes(16))
-        padder = PKCS7(128).padder()
-        padded_data = padder.update(data)
-        padded_data += padder.finalize()
+        iv = bytes(self.get_random_bytes(16))
+        # PKCS#7 padding to the 16 bytes AES block size, in a single allocation:
+        pad_length = 16 - len(data) % 16
+        padded_data = data + bytes((pad_length,)) * pad_length
         cipher = (
             Cipher(AES128(key), modes.CBC(iv))
             if self.encryption_method == EncryptionMethod.AES_128
-            else Cipher(AES256(self.k), modes.CBC(iv))
+            else Cipher(AES256(key), modes.CBC(iv))
         )
         encryptor = cipher.encryptor()
-        data = encryptor.update(padded_data) + encryptor.finalize()
-        iv.extend(data)
-        return iv
+        return iv + encryptor.update(padded_data) + encryptor.finalize()
 
     @classmethod
     def get_random_bytes(cls: Type["StandardSecurityHandler"], size: int) -> bytes:
@@ -368,16 +406,13 @@ class StandardSecurityHandler:
 
         return prepared_string.encode("UTF-8")
 
-    def padded_password(self, password: str) -> bytearray:
+    def padded_password(self, password: str) -> bytes:
         """
         PDF32000 reference - Algorithm 2: Computing an encryption key
         Step (a) - Add the default padding at the end of provided password to make it 32 bit long
         """
-        if len(password) > 32:
-            password = password[:32]
-        p = bytearray(password.encode("latin1"))
-        p.extend(self.DEFAULT_PADDING[: (32 - len(p))])
-        return p
+        p = password.encode("latin1")[:32]
+        return p + self.DEFAULT_PADDING[: (32 - len(p))]
 
     def generate_owner_password(self) -> str:
         """
@@ -387,14 +422,9 @@ class StandardSecurityHandler:
         m = self.padded_password(self.owner_password)
         for _ in range(51):
             m = md5(m)
-        rc4key = m[: (math.ceil(self.key_length / 8))]
-        result = self.padded_password(self.user_password)
-        for i in range(20):
-            new_key = []
-            for k in rc4key:
-                new_key.append(k ^ i)
-            result = ARC4().encrypt(bytes(new_key), result)
-        return bytes(result).hex()
+        rc4key = m[: (self.key_length + 7) >> 3]
+        result = arc4_20_rounds(rc4key, self.padded_password(self.user_password))
+        return result.hex()
 
     def generate_user_password(self) -> str:
         """
@@ -402,19 +432,15 @@ class StandardSecurityHandler:
         The security handler is only using revision 3 or 4, so the legacy r2 version is not implemented here
         """
         m = hashlib.new("md5", usedforsecurity=False)
-        m.update(bytearray(self.DEFAULT_PADDING))
+        m.update(self.DEFAULT_PADDING)
         m.update(bytes.fromhex(self.info_id))
-        result = bytearray(m.digest())
-        key = self.k
-        for i in range(20):
-            new_key = []
-            for k in key:
-                new_key.append(k ^ i)
-            result = ARC4().encrypt(bytes(new_key), result)
-        result.extend(
-            (result[x] ^ self.DEFAULT_PADDING[x]) for x in range(16)
-        )  # add 16 bytes of random padding
-        return bytes(result).hex()
+        result = arc4_20_rounds(self.k, m.digest())
+        # add 16 bytes of random padding, XORing the 16 bytes at once:
+        result += (
+            int.from_bytes(result[:16], "big")
+            ^ int.from_bytes(self.DEFAULT_PADDING[:16], "big")
+        ).to_bytes(16, "big")
+        return result.hex()
 
     @classmethod
     def compute_hash(
@@ -544,16 +570,26 @@ class StandardSecurityHandler:
         m.update(bytes.fromhex(self.info_id))
         if self.encrypt_metadata is False and self.version == 4:
             m.update(bytes([0xFF, 0xFF, 0xFF, 0xFF]))
-        result = m.digest()[: (math.ceil(self.key_length / 8))]
+        key_length = (self.key_length + 7) >> 3  # in bytes, rounded up
+        result = m.digest()[:key_length]
         for _ in range(50):
-            result = md5(result)[: (math.ceil(self.key_length / 8))]
+            result = md5(result)[:key_length]
         return result
 
 
 def md5(data: Union[bytes, bytearray]) -> bytes:
-    h = hashlib.new("md5", usedforsecurity=False)
-    h.update(data)
-    return h.digest()
+    return hashlib.new("md5", data, usedforsecurity=False).digest()
+
+
+def arc4_20_rounds(key: bytes, data: Union[bytes, bytearray]) -> bytes:
+    """
+    Step shared by algorithms 3 & 5 of the PDF32000 reference:
+    encrypt the data 20 times, using the key XORed with the round number (0 to 19)
+    """
+    arc4 = ARC4()
+    for round_key in [bytes(k ^ i for k in key) for i in range(20)]:
+        data = arc4.encrypt(round_key, data)
+    return data
 
 
 def int32(n: int) -> int:
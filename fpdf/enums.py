@@ -1,4 +1,6 @@
 from enum import Enum, IntEnum, Flag, IntFlag
+from functools import reduce
+from operator import or_
 from sys import intern
 
 from .syntax import Name
@@ -905,10 +907,7 @@ class AccessPermission(IntFlag):
     @classmethod
     def all(cls):
         "All flags enabled"
-        result = 0
-        for permission in list(AccessPermission):
-            result = result | permission
-        return result
+        return reduce(or_, cls, 0)
 
     @classmethod
     def none(cls):
@@ -200,7 +200,7 @@ class CoreFont:
         self.emphasis = TextEmphasis.coerce(style)
 
     def get_text_width(self, text, font_size_pt, _):
-        return (len(text), sum(self.cw[c] for c in text) * font_size_pt * 0.001)
+        return (len(text), sum(map(self.cw.__getitem__, text)) * font_size_pt * 0.001)
 
     # Disabling this check - method kept as is to have same method/signature on CoreConf and TTFFont:
     # pylint: disable=no-self-use
@@ -328,7 +328,10 @@ class TTFFont:
     def get_text_width(self, text, font_size_pt, text_shaping_parms):
         if text_shaping_parms:
             return self.shaped_text_width(text, font_size_pt, text_shaping_parms)
-        return (len(text), sum(self.cw[ord(c)] for c in text) * font_size_pt * 0.001)
+        return (
+            len(text),
+            sum(map(self.cw.__getitem__, map(ord, text))) * font_size_pt * 0.001,
+        )
 
     def shaped_text_width(self, text, font_size_pt, text_shaping_parms):
         """
@@ -12,7 +12,7 @@ import hashlib, io, logging, math, os, re, sys, types, warnings
 from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from math import isclose
 from numbers import Number
 from os.path import splitext
@@ -140,6 +140,9 @@ LAYOUT_ALIASES = {
     "continuous": PageLayout.ONE_COLUMN,
     "two": PageLayout.TWO_COLUMN_LEFT,
 }
+# Distance from the end points to the control points of the 4 Bézier curves approximating an ellipse,
+# relative to its radius:
+BEZIER_KAPPA = 4 / 3 * (math.sqrt(2) - 1)
 
 
 class ToCPlaceholder(NamedTuple):
@@ -199,6 +202,19 @@ def check_page(fn):
     return wrapper
 
 
+@lru_cache(maxsize=128)
+def _regular_polygon_vertices(num_sides, rotate_degrees):
+    "Return the vertices of a regular polygon inscribed in a circle of radius 1 centered on the origin"
+    rotation = math.radians(rotate_degrees)
+    return tuple(
+        (
+            math.cos(math.radians((360 / num_sides) * i) + rotation),
+            math.sin(math.radians((360 / num_sides) * i) + rotation),
+        )
+        for i in range(1, num_sides + 1)
+    )
+
+
 class FPDF(GraphicsStateMixin, TextRegionMixin):
     "PDF Generation class"
     MARKDOWN_BOLD_MARKER = "**"
@@ -324,6 +340,8 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         self._page_mode = None
         self.viewer_preferences = None  # optional instance of ViewerPreferences
         self.compress = True  # switch enabling pages content compression
+        # Passed to zlib.compress() - In range 0-9 - Default is currently equivalent to 6:
+        self.compression_level = -1
         self.pdf_version = "1.3"  # Set default PDF version No.
         self.creation_date = datetime.now(timezone.utc)
         self._security_handler = None
@@ -656,7 +674,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         if self._page_layout in (PageLayout.TWO_PAGE_LEFT, PageLayout.TWO_PAGE_RIGHT):
             self._set_min_pdf_version("1.5")
 
-    def set_compression(self, compress):
+    def set_compression(self, compress, level=-1):
         """
         Activates or deactivates page compression.
 
@@ -668,8 +686,12 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
 
         Args:
             compress (bool): indicates if compression should be enabled
+            level (int): zlib compression level, from 0 to 9. Lower levels are faster,
+                at the cost of slightly bigger documents.
+                Default to -1, which is currently equivalent to 6.
         """
         self.compress = compress
+        self.compression_level = level
 
     def set_title(self, title):
         """
@@ -1147,6 +1169,12 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         else:
             rendered = context.render(*render_args)
 
+        # The drawing API makes use of features (notably transparency and blending modes) that were introduced in PDF 1.4:
+        self._set_min_pdf_version("1.4")
+        if not rendered:
+            # Empty drawings do not add a blank line to the page content stream:
+            return
+
         self.graphics_style_names_per_page_number[self.page].update(
             match.group(1) for match in self._GS_REGEX.finditer(rendered)
         )
@@ -1158,8 +1186,6 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         # we should also detect fonts used and add them to self.fonts_used_per_page_number
 
         self._out(rendered)
-        # The drawing API makes use of features (notably transparency and blending modes) that were introduced in PDF 1.4:
-        self._set_min_pdf_version("1.4")
 
     def _current_graphic_style(self):
         gs = GraphicsStyle()
@@ -1268,9 +1294,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             x2 (float): Abscissa of second point
             y2 (float): Ordinate of second point
         """
+        k, h = self.k, self.h
         self._out(
-            f"{x1 * self.k:.2f} {(self.h - y1) * self.k:.2f} m {x2 * self.k:.2f} "
-            f"{(self.h - y2) * self.k:.2f} l S"
+            "%.2f %.2f m %.2f %.2f l S" % (x1 * k, (h - y1) * k, x2 * k, (h - y2) * k)
         )
 
     @check_page
@@ -1306,11 +1332,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 raise ValueError(
                     f"Conflicting values provided: fill={fill} & style={style}"
                 )
+        k, h, out = self.k, self.h, self._out
         operator = "m"
         for point in point_list:
-            self._out(
-                f"{point[0] * self.k:.2f} {(self.h - point[1]) * self.k:.2f} {operator}"
-            )
+            out("%.2f %.2f %s" % (point[0] * k, (h - point[1]) * k, operator))
             operator = "l"
         if polygon:
             self._out(" h")
@@ -1395,9 +1420,10 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         if round_corners is not False:
             self._draw_rounded_rect(x, y, w, h, style, round_corners, corner_radius)
         else:
+            k = self.k
             self._out(
-                f"{x * self.k:.2f} {(self.h - y) * self.k:.2f} {w * self.k:.2f} "
-                f"{-h * self.k:.2f} re {style.operator}"
+                "%.2f %.2f %.2f %.2f re %s"
+                % (x * k, (self.h - y) * k, w * k, -h * k, style.operator)
             )
 
     def _draw_rounded_rect(self, x, y, w, h, style, round_corners, r):
@@ -1495,37 +1521,24 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         rx = w / 2
         ry = h / 2
 
-        lx = 4 / 3 * (math.sqrt(2) - 1) * rx
-        ly = 4 / 3 * (math.sqrt(2) - 1) * ry
+        lx = BEZIER_KAPPA * rx
+        ly = BEZIER_KAPPA * ry
 
-        self._out(
-            (
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} m "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy + ly) * self.k:.2f} "
-                f"{(cx + lx) * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} "
-                f"{cx * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} c"
-            )
-        )
-        self._out(
-            (
-                f"{(cx - lx) * self.k:.2f} {(self.h - cy + ry) * self.k:.2f} "
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy + ly) * self.k:.2f} "
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} c"
-            )
+        # Each of the 5 distinct abscissas & ordinates of the 4 Bézier curves
+        # is formatted only once, and the curves are emitted as a single block:
+        k = self.k
+        x0, x1, x2, x3, x4 = (
+            f"{v * k:.2f}" for v in (cx - rx, cx - lx, cx, cx + lx, cx + rx)
         )
-        self._out(
-            (
-                f"{(cx - rx) * self.k:.2f} {(self.h - cy - ly) * self.k:.2f} "
-                f"{(cx - lx) * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} "
-                f"{cx * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} c"
-            )
+        ty = self.h - cy
+        y0, y1, y2, y3, y4 = (
+            f"{v * k:.2f}" for v in (ty - ry, ty - ly, ty, ty + ly, ty + ry)
         )
         self._out(
-            (
-                f"{(cx + lx) * self.k:.2f} {(self.h - cy - ry) * self.k:.2f} "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy - ly) * self.k:.2f} "
-                f"{(cx + rx) * self.k:.2f} {(self.h - cy) * self.k:.2f} c {operator}"
-            )
+            f"{x4} {y2} m {x4} {y3} {x3} {y4} {x2} {y4} c\n"
+            f"{x1} {y4} {x0} {y3} {x0} {y2} c\n"
+            f"{x0} {y1} {x1} {y0} {x2} {y0} c\n"
+            f"{x3} {y0} {x4} {y1} {x4} {y2} c {operator}"
         )
 
     @check_page
@@ -1569,15 +1582,11 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         centerX = x + radius
         centerY = y - radius
         # center point is (centerX, centerY)
-        points = []
-        for i in range(1, numSides + 1):
-            point = centerX + radius * math.cos(
-                math.radians((360 / numSides) * i) + math.radians(rotateDegrees)
-            ), centerY + radius * math.sin(
-                math.radians((360 / numSides) * i) + math.radians(rotateDegrees)
-            )
-            points.append(point)
-        # creates list of touples containing cordinate points of vertices
+        # creates list of touples containing cordinate points of vertices:
+        points = [
+            (centerX + radius * cos, centerY + radius * sin)
+            for cos, sin in _regular_polygon_vertices(numSides, rotateDegrees)
+        ]
 
         self.polygon(points, style=style)
         # passes points through polygon function
@@ -1728,6 +1737,7 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         eta2 = start_eta
         p2 = evaluate(eta2)
         p2_prime = derivative_evaluate(eta2)
+        k, h = self.k, self.h
 
         for i in range(n):
             p1 = p2
@@ -1744,11 +1754,17 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             if i == n - 1 and not end_at_center:
                 end = f" {style.operator}"
 
+            # %-formatting all the coordinates at once is faster than a f-string:
             self._out(
-                (
-                    f"{control_point_1[0] * self.k:.2f} {(self.h - control_point_1[1]) * self.k:.2f} "
-                    f"{control_point_2[0] * self.k:.2f} {(self.h - control_point_2[1]) * self.k:.2f} "
-                    f"{p2[0] * self.k:.2f} {(self.h - p2[1]) * self.k:.2f} c" + end
+                "%.2f %.2f %.2f %.2f %.2f %.2f c%s"
+                % (
+                    control_point_1[0] * k,
+                    (h - control_point_1[1]) * k,
+                    control_point_2[0] * k,
+                    (h - control_point_2[1]) * k,
+                    p2[0] * k,
+                    (h - p2[1]) * k,
+                    end,
                 )
             )
 
@@ -2559,11 +2575,9 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
                 h = self.font_size
                 y -= 0.8 * h  # same coefficient as in _render_styled_text_line()
                 self._add_quad_points(x, y, w, h)
-        attr_l = []
         if self.fill_color != self.text_color:
-            attr_l.append(f"{self.text_color.serialize().lower()}")
-        if attr_l:
-            sl = ["q"] + attr_l + sl + ["Q"]
+            sl.insert(0, f"q {self.text_color.serialize().lower()}")
+            sl.append("Q")
         self._out(" ".join(sl))
 
     @check_page
@@ -3104,22 +3118,29 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
         top = (self.h - self.y + padding.top) * k
         bottom = (self.h - (self.y + h) - padding.bottom) * k
 
-        if fill:
-            op = "B" if border == 1 else "f"
-            sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re {op}")
+        if fill and border == 1:
+            sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re B")
+        elif fill and right != left and bottom != top:
+            # a background without any area would be invisible, so it is skipped
+            sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re f")
         elif border == 1:
             sl.append(f"{left:.2f} {top:.2f} {right-left:.2f} {bottom-top:.2f} re S")
         # pylint: enable=invalid-unary-operand-type
 
         if isinstance(border, str):
+            # each edge coordinate is shared by 2 borders, so it is only formatted once:
+            x1 = f"{left:.2f}"
+            y1 = f"{top:.2f}"
+            x2 = f"{right:.2f}"
+            y2 = f"{bottom:.2f}"
             if "L" in border:
-                sl.append(f"{left:.2f} {top:.2f} m {left:.2f} {bottom:.2f} l S")
+                sl.append(f"{x1} {y1} m {x1} {y2} l S")
             if "T" in border:
-                sl.append(f"{left:.2f} {top:.2f} m {right:.2f} {top:.2f} l S")
+                sl.append(f"{x1} {y1} m {x2} {y1} l S")
             if "R" in border:
-                sl.append(f"{right:.2f} {top:.2f} m {right:.2f} {bottom:.2f} l S")
+                sl.append(f"{x2} {y1} m {x2} {y2} l S")
             if "B" in border:
-                sl.append(f"{left:.2f} {bottom:.2f} m {right:.2f} {bottom:.2f} l S")
+                sl.append(f"{x1} {y2} m {x2} {y2} l S")
 
         if self._record_text_quad_points:
             self._add_quad_points(self.x, self.y, w, h)
@@ -3361,16 +3382,18 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             # We set the current to page to zero so that
             # set_font() does not produce any text object on the stream buffer:
             self.page = 0
-            if any(frag.font_style == "B" for frag in styled_txt_frags):
+            # A single pass over the fragments, instead of one per font style:
+            font_styles = {frag.font_style for frag in styled_txt_frags}
+            if "B" in font_styles:
                 # Ensuring bold font is supported:
                 self.set_font(style="B")
-            if any(frag.font_style == "I" for frag in styled_txt_frags):
+            if "I" in font_styles:
                 # Ensuring italics font is supported:
                 self.set_font(style="I")
-            if any(frag.font_style == "BI" for frag in styled_txt_frags):
+            if "BI" in font_styles:
                 # Ensuring bold italics font is supported:
                 self.set_font(style="BI")
-            if any(frag.font_style == "" for frag in styled_txt_frags):
+            if "" in font_styles:
                 # Ensuring base font is supported:
                 self.set_font(style="")
             for frag in styled_txt_frags:
@@ -4728,7 +4751,11 @@ class FPDF(GraphicsStateMixin, TextRegionMixin):
             s = s.encode("latin1")
         if not self.page:
             raise FPDFException("No page open, you need to call add_page() first")
-        self.pages[self.page].contents += s + b"\n"
+        # Extending the page bytearray in place avoids copying `s` once more,
+        # which matters for large rendered drawings:
+        contents = self.pages[self.page].contents
+        contents += s
+        contents += b"\n"
 
     @check_page
     @support_deprecated_txt_arg
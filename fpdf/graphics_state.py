@@ -6,13 +6,40 @@ They may change at any time without prior warning or any deprecation period,
 in non-backward-compatible ways.
 """
 
-from copy import copy
-
 from .drawing import DeviceGray
 from .enums import CharVPos, TextEmphasis, TextMode
 from .fonts import FontFace
 
 
+# The initial graphics state of all documents. Its entries are listed in the order
+# in which they are stored, with the values set by GraphicsStateMixin.__init__ as None:
+_DEFAULT_GRAPHICS_STATE = dict(
+    draw_color=None,
+    fill_color=None,
+    text_color=None,
+    underline=False,
+    font_style="",
+    font_stretching=100,
+    char_spacing=0,
+    font_family="",
+    font_size_pt=0,
+    current_font=None,
+    dash_pattern=None,
+    line_width=0,
+    text_mode=TextMode.FILL,
+    char_vpos=CharVPos.LINE,
+    sub_scale=0.7,
+    sup_scale=0.7,
+    nom_scale=0.75,
+    denom_scale=0.75,
+    sub_lift=-0.15,
+    sup_lift=0.4,
+    nom_lift=0.2,
+    denom_lift=0.0,
+    text_shaping=None,
+)
+
+
 class GraphicsStateMixin:
     """Mixin class for managing a stack of graphics state variables.
 
@@ -30,50 +57,42 @@ class GraphicsStateMixin:
     DEFAULT_TEXT_COLOR = DeviceGray(0)
 
     def __init__(self, *args, **kwargs):
-        self.__statestack = [
-            dict(
-                draw_color=self.DEFAULT_DRAW_COLOR,
-                fill_color=self.DEFAULT_FILL_COLOR,
-                text_color=self.DEFAULT_TEXT_COLOR,
-                underline=False,
-                font_style="",
-                font_stretching=100,
-                char_spacing=0,
-                font_family="",
-                font_size_pt=0,
-                current_font={},
-                dash_pattern=dict(dash=0, gap=0, phase=0),
-                line_width=0,
-                text_mode=TextMode.FILL,
-                char_vpos=CharVPos.LINE,
-                sub_scale=0.7,
-                sup_scale=0.7,
-                nom_scale=0.75,
-                denom_scale=0.75,
-                sub_lift=-0.15,
-                sup_lift=0.4,
-                nom_lift=0.2,
-                denom_lift=0.0,
-                text_shaping=None,
-            )
-        ]
+        gs = _DEFAULT_GRAPHICS_STATE.copy()
+        # Those defaults can be overridden by subclasses:
+        gs["draw_color"] = self.DEFAULT_DRAW_COLOR
+        gs["fill_color"] = self.DEFAULT_FILL_COLOR
+        gs["text_color"] = self.DEFAULT_TEXT_COLOR
+        # Mutable values must not be shared between documents:
+        gs["current_font"] = {}
+        gs["dash_pattern"] = dict(dash=0, gap=0, phase=0)
+        self.__statestack = [gs]
+        # The top of the stack is read by every property below,
+        # so it is kept as an attribute, updated on each push & pop:
+        self.__current = self.__statestack[-1]
+        # (key, value) of the last FontFace returned by .font_face():
+        self.__last_font_face = (None, None)
         super().__init__(*args, **kwargs)
 
     def _push_local_stack(self, new=None):
-        if new:
-            self.__statestack.append(new)
-        else:
-            self.__statestack.append(self._get_current_graphics_state())
+        if not new:
+            new = self._get_current_graphics_state()
+        self.__statestack.append(new)
+        self.__current = new
 
     def _pop_local_stack(self):
-        return self.__statestack.pop()
+        gs = self.__statestack.pop()
+        self.__current = self.__statestack[-1]
+        return gs
 
     def _get_current_graphics_state(self):
         # "current_font" must be shallow copied
         # "text_shaping" must be deep copied (different fragments may have different languages/direction)
-        # Doing a whole copy and then creating a copy of text_shaping to achieve this result
-        gs = copy(self.__statestack[-1])
-        gs["text_shaping"] = copy(gs["text_shaping"])
+        # Doing a whole copy and then creating a copy of text_shaping to achieve this result.
+        # Both are plain dicts, so dict.copy() is used rather than the slower copy.copy():
+        gs = self.__current.copy()
+        text_shaping = gs["text_shaping"]
+        if text_shaping is not None:
+            gs["text_shaping"] = text_shaping.copy()
         return gs
 
     def _is_current_graphics_state_nested(self):
@@ -81,115 +100,118 @@ class GraphicsStateMixin:
 
     @property
     def draw_color(self):
-        return self.__statestack[-1]["draw_color"]
+        return self.__current["draw_color"]
 
     @draw_color.setter
     def draw_color(self, v):
-        self.__statestack[-1]["draw_color"] = v
+        self.__current["draw_color"] = v
 
     @property
     def fill_color(self):
-        return self.__statestack[-1]["fill_color"]
+        return self.__current["fill_color"]
 
     @fill_color.setter
     def fill_color(self, v):
-        self.__statestack[-1]["fill_color"] = v
+        self.__current["fill_color"] = v
 
     @property
     def text_color(self):
-        return self.__statestack[-1]["text_color"]
+        return self.__current["text_color"]
 
     @text_color.setter
     def text_color(self, v):
-        self.__statestack[-1]["text_color"] = v
+        self.__current["text_color"] = v
 
     @property
     def underline(self):
-        return self.__statestack[-1]["underline"]
+        return self.__current["underline"]
 
     @underline.setter
     def underline(self, v):
-        self.__statestack[-1]["underline"] = v
+        self.__current["underline"] = v
 
     @property
     def font_style(self):
-        return self.__statestack[-1]["font_style"]
+        return self.__current["font_style"]
 
     @font_style.setter
     def font_style(self, v):
-        self.__statestack[-1]["font_style"] = v
+        self.__current["font_style"] = v
 
     @property
     def font_stretching(self):
-        return self.__statestack[-1]["font_stretching"]
+        return self.__current["font_stretching"]
 
     @font_stretching.setter
     def font_stretching(self, v):
-        self.__statestack[-1]["font_stretching"] = v
+        self.__current["font_stretching"] = v
 
     @property
     def char_spacing(self):
-        return self.__statestack[-1]["char_spacing"]
+        return self.__current["char_spacing"]
 
     @char_spacing.setter
     def char_spacing(self, v):
-        self.__statestack[-1]["char_spacing"] = v
+        self.__current["char_spacing"] = v
 
     @property
     def font_family(self):
-        return self.__statestack[-1]["font_family"]
+        return self.__current["font_family"]
 
     @font_family.setter
     def font_family(self, v):
-        self.__statestack[-1]["font_family"] = v
+        self.__current["font_family"] = v
 
     @property
     def font_size_pt(self):
-        return self.__statestack[-1]["font_size_pt"]
+        return self.__current["font_size_pt"]
 
     @font_size_pt.setter
     def font_size_pt(self, v):
-        self.__statestack[-1]["font_size_pt"] = v
+        self.__current["font_size_pt"] = v
 
     @property
     def font_size(self):
-        return self.__statestack[-1]["font_size_pt"] / self.k
+        return self.__current["font_size_pt"] / self.k
 
     @font_size.setter
     def font_size(self, v):
-        self.__statestack[-1]["font_size_pt"] = v * self.k
+        self.__current["font_size_pt"] = v * self.k
 
     @property
     def current_font(self):
-        return self.__statestack[-1]["current_font"]
+        return self.__current["current_font"]
 
     @current_font.setter
     def current_font(self, v):
-        self.__statestack[-1]["current_font"] = v
+        self.__current["current_font"] = v
 
     @property
     def dash_pattern(self):
-        return self.__statestack[-1]["dash_pattern"]
+        return self.__current["dash_pattern"]
 
     @dash_pattern.setter
     def dash_pattern(self, v):
-        self.__statestack[-1]["dash_pattern"] = v
+        self.__current["dash_pattern"] = v
 
     @property
     def line_width(self):
-        return self.__statestack[-1]["line_width"]
+        return self.__current["line_width"]
 
     @line_width.setter
     def line_width(self, v):
-        self.__statestack[-1]["line_width"] = v
+        self.__current["line_width"] = v
 
     @property
     def text_mode(self):
-        return self.__statestack[-1]["text_mode"]
+        return self.__current["text_mode"]
 
     @text_mode.setter
     def text_mode(self, v):
-        self.__statestack[-1]["text_mode"] = TextMode.coerce(v)
+        # fpdf2 internals set enum members, which do not need to be coerced:
+        self.__current["text_mode"] = (
+            v if v.__class__ is TextMode else TextMode.coerce(v)
+        )
 
     @property
     def char_vpos(self):
@@ -197,7 +219,7 @@ class GraphicsStateMixin:
         Return vertical character position relative to line.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["char_vpos"]
+        return self.__current["char_vpos"]
 
     @char_vpos.setter
     def char_vpos(self, v):
@@ -205,7 +227,9 @@ class GraphicsStateMixin:
         Set vertical character position relative to line.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["char_vpos"] = CharVPos.coerce(v)
+        self.__current["char_vpos"] = (
+            v if v.__class__ is CharVPos else CharVPos.coerce(v)
+        )
 
     @property
     def sub_scale(self):
@@ -213,7 +237,7 @@ class GraphicsStateMixin:
         Return scale factor for subscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["sub_scale"]
+        return self.__current["sub_scale"]
 
     @sub_scale.setter
     def sub_scale(self, v):
@@ -221,7 +245,7 @@ class GraphicsStateMixin:
         Set scale factor for subscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["sub_scale"] = float(v)
+        self.__current["sub_scale"] = float(v)
 
     @property
     def sup_scale(self):
@@ -229,7 +253,7 @@ class GraphicsStateMixin:
         Return scale factor for superscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["sup_scale"]
+        return self.__current["sup_scale"]
 
     @sup_scale.setter
     def sup_scale(self, v):
@@ -237,7 +261,7 @@ class GraphicsStateMixin:
         Set scale factor for superscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["sup_scale"] = float(v)
+        self.__current["sup_scale"] = float(v)
 
     @property
     def nom_scale(self):
@@ -245,7 +269,7 @@ class GraphicsStateMixin:
         Return scale factor for nominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["nom_scale"]
+        return self.__current["nom_scale"]
 
     @nom_scale.setter
     def nom_scale(self, v):
@@ -253,7 +277,7 @@ class GraphicsStateMixin:
         Set scale factor for nominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["nom_scale"] = float(v)
+        self.__current["nom_scale"] = float(v)
 
     @property
     def denom_scale(self):
@@ -261,7 +285,7 @@ class GraphicsStateMixin:
         Return scale factor for denominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["denom_scale"]
+        return self.__current["denom_scale"]
 
     @denom_scale.setter
     def denom_scale(self, v):
@@ -269,7 +293,7 @@ class GraphicsStateMixin:
         Set scale factor for denominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["denom_scale"] = float(v)
+        self.__current["denom_scale"] = float(v)
 
     @property
     def sub_lift(self):
@@ -277,7 +301,7 @@ class GraphicsStateMixin:
         Return lift factor for subscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["sub_lift"]
+        return self.__current["sub_lift"]
 
     @sub_lift.setter
     def sub_lift(self, v):
@@ -285,7 +309,7 @@ class GraphicsStateMixin:
         Set lift factor for subscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["sub_lift"] = float(v)
+        self.__current["sub_lift"] = float(v)
 
     @property
     def sup_lift(self):
@@ -293,7 +317,7 @@ class GraphicsStateMixin:
         Return lift factor for superscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["sup_lift"]
+        return self.__current["sup_lift"]
 
     @sup_lift.setter
     def sup_lift(self, v):
@@ -301,7 +325,7 @@ class GraphicsStateMixin:
         Set lift factor for superscript text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["sup_lift"] = float(v)
+        self.__current["sup_lift"] = float(v)
 
     @property
     def nom_lift(self):
@@ -309,7 +333,7 @@ class GraphicsStateMixin:
         Return lift factor for nominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["nom_lift"]
+        return self.__current["nom_lift"]
 
     @nom_lift.setter
     def nom_lift(self, v):
@@ -317,7 +341,7 @@ class GraphicsStateMixin:
         Set lift factor for nominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["nom_lift"] = float(v)
+        self.__current["nom_lift"] = float(v)
 
     @property
     def denom_lift(self):
@@ -325,7 +349,7 @@ class GraphicsStateMixin:
         Return lift factor for denominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        return self.__statestack[-1]["denom_lift"]
+        return self.__current["denom_lift"]
 
     @denom_lift.setter
     def denom_lift(self, v):
@@ -333,30 +357,43 @@ class GraphicsStateMixin:
         Set lift factor for denominator text.
         ([docs](../TextStyling.html#subscript-superscript-and-fractional-numbers))
         """
-        self.__statestack[-1]["denom_lift"] = float(v)
+        self.__current["denom_lift"] = float(v)
 
     @property
     def text_shaping(self):
-        return self.__statestack[-1]["text_shaping"]
+        return self.__current["text_shaping"]
 
     @text_shaping.setter
     def text_shaping(self, v):
         if v:
-            self.__statestack[-1]["text_shaping"] = v
+            self.__current["text_shaping"] = v
 
     def font_face(self):
         """
         Return a `fpdf.fonts.FontFace` instance
         representing a subset of properties of this GraphicsState.
         """
-        return FontFace(
-            family=self.font_family,
-            emphasis=TextEmphasis.coerce(self.font_style),
-            size_pt=self.font_size_pt,
-            color=(
-                self.text_color if self.text_color != self.DEFAULT_TEXT_COLOR else None
-            ),
-            fill_color=(
-                self.fill_color if self.fill_color != self.DEFAULT_FILL_COLOR else None
-            ),
+        gs = self.__current
+        key = (
+            gs["font_family"],
+            gs["font_style"],
+            gs["font_size_pt"],
+            gs["text_color"],
+            gs["fill_color"],
         )
+        # This is called for every table cell, usually with the same settings,
+        # so the last instance built is returned again if nothing has changed:
+        last_key, font_face = self.__last_font_face
+        if key != last_key:
+            family, style, size_pt, text_color, fill_color = key
+            font_face = FontFace(
+                family=family,
+                emphasis=TextEmphasis.coerce(style),
+                size_pt=size_pt,
+                color=text_color if text_color != self.DEFAULT_TEXT_COLOR else None,
+                fill_color=(
+                    fill_color if fill_color != self.DEFAULT_FILL_COLOR else None
+                ),
+            )
+            self.__last_font_face = (key, font_face)
+        return font_face
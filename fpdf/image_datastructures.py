@@ -37,15 +37,15 @@ class ImageInfo(dict):
         Make an image fit within a bounding box, maintaining its proportions.
         In the reduced dimension it will be centered within the available space.
         """
-        ratio = self.width / self.height
-        if h * ratio < w:
-            new_w = h * ratio
+        ratio = self["w"] / self["h"]
+        new_w = h * ratio
+        if new_w < w:
             new_h = h
-            x += (w - new_w) / 2
+            x += (w - new_w) * 0.5
         else:  # => too wide, limiting width:
             new_h = w / ratio
             new_w = w
-            y += (h - new_h) / 2
+            y += (h - new_h) * 0.5
         return x, y, new_w, new_h
 
 
@@ -74,6 +74,8 @@ class ImageCache:
     images: Dict[str, dict] = field(default_factory=dict)
     # Map icc profiles (bytes) to their index (number)
     icc_profiles: Dict[bytes, int] = field(default_factory=dict)
+    # Map the MD5 hash of SVG documents to their parsed SVGObject & VectorImageInfo
+    vector_images: Dict[str, tuple] = field(default_factory=dict)
     # Must be one of SUPPORTED_IMAGE_FILTERS values
     image_filter: str = "AUTO"
 
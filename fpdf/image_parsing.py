@@ -127,12 +127,10 @@ def preload_image(image_cache: ImageCache, name, dims=None):
                 "ICC profile found for image %s - It will be inserted in the PDF document",
                 name,
             )
-            if iccp in image_cache.icc_profiles:
-                info["iccp_i"] = image_cache.icc_profiles[iccp]
-            else:
-                iccp_i = len(image_cache.icc_profiles)
-                image_cache.icc_profiles[iccp] = iccp_i
-                info["iccp_i"] = iccp_i
+            # Identical profiles share the same index, with a single dict lookup:
+            info["iccp_i"] = image_cache.icc_profiles.setdefault(
+                iccp, len(image_cache.icc_profiles)
+            )
             info["iccp"] = None
         image_cache.images[name] = info
     return name, img, info
@@ -194,7 +192,16 @@ def is_iccp_valid(iccp, filename):
 
 
 def get_svg_info(filename, img, image_cache):
-    svg = SVGObject(img.getvalue(), image_cache=image_cache)
+    svg_bytes = img.getvalue()
+    # Parsing & converting a SVG document is costly,
+    # so identical documents inserted several times are only processed once:
+    svg_hash = hashlib.new("md5", usedforsecurity=False)  # nosec B324
+    svg_hash.update(svg_bytes)
+    svg_hash = svg_hash.hexdigest()
+    cached = image_cache.vector_images.get(svg_hash)
+    if cached:
+        return (filename, *cached)
+    svg = SVGObject(svg_bytes, image_cache=image_cache)
     if svg.viewbox:
         _, _, w, h = svg.viewbox
     else:
@@ -204,6 +211,7 @@ def get_svg_info(filename, img, image_cache):
     if svg.height:
         h = svg.height
     info = VectorImageInfo(data=svg, w=w, h=h)
+    image_cache.vector_images[svg_hash] = svg, info
     return filename, svg, info
 
 
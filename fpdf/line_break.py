@@ -39,6 +39,8 @@ BREAKING_SPACE_SYMBOLS_STR = "".join(BREAKING_SPACE_SYMBOLS)
 NBSP = "\u00a0"
 NEWLINE = "\n"
 FORM_FEED = "\u000c"
+# A space character, encoded the way text is rendered with TTF fonts:
+_ESCAPED_UTF16_SPACE = escape_parens(SPACE.encode("utf-16-be").decode("latin-1"))
 
 
 class Fragment:
@@ -46,6 +48,8 @@ class Fragment:
     A fragment of text with font/size/style and other associated information.
     """
 
+    __slots__ = ("characters", "graphics_state", "k", "link")  # RAM usage optimization
+
     def __init__(
         self,
         characters: Union[list, str],
@@ -254,15 +258,13 @@ class Fragment:
 
     def render_pdf_text_ttf(self, frag_ws, word_spacing):
         ret = ""
-        mapped_text = ""
-        for char in self.string:
-            mapped_char = self.font.subset.pick(ord(char))
-            if mapped_char:
-                mapped_text += chr(mapped_char)
+        pick = self.font.subset.pick
+        mapped_text = "".join(
+            chr(mapped_char)
+            for mapped_char in (pick(ord(char)) for char in self.string)
+            if mapped_char
+        )
         if word_spacing:
-            # do this once in advance
-            u_space = escape_parens(" ".encode("utf-16-be").decode("latin-1"))
-
             # According to the PDF reference, word spacing shall be applied to every
             # occurrence of the single-byte character code 32 in a string when using
             # a simple font or a composite font that defines code 32 as a single-byte code.
@@ -272,18 +274,14 @@ class Fragment:
             # Determine the index of the space character (" ") in the current
             # subset and split words whenever this mapping code is found
             #
-            words = mapped_text.split(chr(self.font.subset.pick(ord(" "))))
-            words_strl = []
-            for word_i, word in enumerate(words):
-                # pylint: disable=redefined-loop-name
-                word = escape_parens(word.encode("utf-16-be").decode("latin-1"))
-                if word_i == 0:
-                    words_strl.append(f"({word})")
-                else:
-                    adj = -(frag_ws * self.k) * 1000 / self.font_size_pt
-                    words_strl.append(f"{adj:.3f}({u_space}{word})")
-            escaped_text = " ".join(words_strl)
-            ret += f"[{escaped_text}] TJ"
+            words = mapped_text.split(chr(pick(ord(" "))))
+            # The adjustment is the same before every space, so it is formatted only once:
+            adj = -(frag_ws * self.k) * 1000 / self.font_size_pt
+            escaped_text = f") {adj:.3f}({_ESCAPED_UTF16_SPACE}".join(
+                escape_parens(word.encode("utf-16-be").decode("latin-1"))
+                for word in words
+            )
+            ret += f"[({escaped_text})] TJ"
         else:
             escaped_text = escape_parens(
                 mapped_text.encode("utf-16-be").decode("latin-1")
@@ -292,19 +290,24 @@ class Fragment:
         return ret
 
     def render_with_text_shaping(self, pos_x, pos_y, h, word_spacing):
-        ret = ""
-        text = ""
+        # Operators & glyphs are accumulated in lists and joined once,
+        # instead of growing strings glyph after glyph:
+        ret = []
+        text = []
         space_mapped_code = self.font.subset.pick(ord(" "))
 
+        # Glyph positions are in font units, and are all converted with the same
+        # composite scale factor, which is therefore computed only once:
+        pos_scale = (
+            self.font.scale
+            * self.font_size_pt
+            * (self.font_stretching / 100)
+            / 1000
+            / self.k
+        )
+
         def adjust_pos(pos):
-            return (
-                pos
-                * self.font.scale
-                * self.font_size_pt
-                * (self.font_stretching / 100)
-                / 1000
-                / self.k
-            )
+            return pos * pos_scale
 
         char_spacing = self.char_spacing * (self.font_stretching / 100) / self.k
         for ti in self.font.shape_text(
@@ -315,14 +318,14 @@ class Fragment:
             char = chr(ti["mapped_char"]).encode("utf-16-be").decode("latin-1")
             if ti["x_offset"] != 0 or ti["y_offset"] != 0:
                 if text:
-                    ret += f"({escape_parens(text)}) Tj "
-                    text = ""
+                    ret.append(f"({escape_parens(''.join(text))}) Tj ")
+                    text = []
                 offsetx = pos_x + adjust_pos(ti["x_offset"])
                 offsety = pos_y - adjust_pos(ti["y_offset"])
-                ret += (
+                ret.append(
                     f"1 0 0 1 {(offsetx) * self.k:.2f} {(h - offsety) * self.k:.2f} Tm "
                 )
-            text += char
+            text.append(char)
             pos_x += adjust_pos(ti["x_advance"]) + char_spacing
             pos_y += adjust_pos(ti["y_advance"])
             if word_spacing and ti["mapped_char"] == space_mapped_code:
@@ -333,13 +336,15 @@ class Fragment:
                 word_spacing and ti["mapped_char"] == space_mapped_code
             ):
                 if text:
-                    ret += f"({escape_parens(text)}) Tj "
-                    text = ""
-                ret += f"1 0 0 1 {(pos_x) * self.k:.2f} {(h - pos_y) * self.k:.2f} Tm "
+                    ret.append(f"({escape_parens(''.join(text))}) Tj ")
+                    text = []
+                ret.append(
+                    f"1 0 0 1 {(pos_x) * self.k:.2f} {(h - pos_y) * self.k:.2f} Tm "
+                )
 
         if text:
-            ret += f"({escape_parens(text)}) Tj"
-        return ret
+            ret.append(f"({escape_parens(''.join(text))}) Tj")
+        return "".join(ret)
 
     def render_pdf_text_core(self, frag_ws, current_ws):
         ret = ""
@@ -219,9 +219,11 @@ class LinearizedOutputProducer(OutputProducer):
                 page_obj.annots = None
         for outline_item in outline_items:
             dests.append(outline_item.dest)
-        # Assigning the .page_ref property of all Destination objects:
+        # Assigning the .page_ref property of all Destination objects,
+        # formatting each page reference only once:
+        page_refs = [pdf_ref(page_obj.id) for page_obj in page_objs]
         for dest in dests:
-            dest.page_ref = pdf_ref(page_objs[dest.page_number - 1].id)
+            dest.page_ref = page_refs[dest.page_number - 1]
         for struct_elem in fpdf.struct_builder.doc_struct_elem.k:
             struct_elem.pg = page_objs[struct_elem.page_number() - 1]
         main_xref.first_xref = first_xref
@@ -246,9 +248,9 @@ class LinearizedOutputProducer(OutputProducer):
                 trace_label = self.trace_labels_per_obj_id.get(pdf_obj.id)
             if trace_label:
                 with self._trace_size(trace_label):
-                    self._out(pdf_obj.serialize())
+                    self._out_serialized(pdf_obj.serialize())
             else:
-                self._out(pdf_obj.serialize())
+                self._out_serialized(pdf_obj.serialize())
         self._log_final_sections_sizes()
 
         # Now that the file size & all the offsets are known,
@@ -8,10 +8,13 @@ in non-backward-compatible ways.
 """
 
 # pylint: disable=protected-access
-import logging
+import logging, zlib
 from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
 from io import BytesIO
+from struct import pack_into
 
 from .annotations import PDFAnnotation
 from .enums import SignatureFlag
@@ -48,6 +51,10 @@ ZOOM_CONFIGS = {  # cf. section 8.2.1 "Destinations" of the 2006 PDF spec 1.7:
     "real": ("/XYZ", "null", "null", "1"),
 }
 
+PAGE_TRANSPARENCY_GROUP = pdf_dict(
+    {"/Type": "/Group", "/S": "/Transparency", "/CS": "/DeviceRGB"}, field_join=" "
+)
+
 
 class ContentWithoutID:
     def serialize(self, _security_handler=None):
@@ -309,12 +316,12 @@ class PDFXrefAndTrailer(ContentWithoutID):
     def serialize(self, _security_handler=None):
         builder = self.output_builder
         startxref = str(len(builder.buffer))
-        out = []
-        out.append("xref")
-        out.append(f"0 {self.count}")
-        out.append("0000000000 65535 f ")
+        # The xref table has one entry per object, so it is directly built as bytes:
+        xref = bytearray(b"xref\n0 %d\n0000000000 65535 f \n" % self.count)
+        offsets = builder.offsets
         for obj_id in range(1, self.count):
-            out.append(f"{builder.offsets[obj_id]:010} 00000 n ")
+            xref += b"%010d 00000 n \n" % offsets[obj_id]
+        out = []
         out.append("trailer")
         out.append("<<")
         out.append(f"/Size {self.count}")
@@ -334,7 +341,8 @@ class PDFXrefAndTrailer(ContentWithoutID):
         out.append("startxref")
         out.append(startxref)
         out.append("%%EOF")
-        return "\n".join(out)
+        xref += "\n".join(out).encode("latin-1")
+        return bytes(xref)
 
 
 class OutputProducer:
@@ -344,6 +352,7 @@ class OutputProducer:
         self.fpdf = fpdf
         self.pdf_objs = []
         self.iccp_i_to_pdf_i = {}
+        self.pal_obj_per_content = {}
         self.obj_id = 0  # current PDF object number
         # array of PDF object offsets in self.buffer, used to build the xref table:
         self.offsets = {}
@@ -417,9 +426,11 @@ class OutputProducer:
                 page_obj.annots = None
         for outline_item in outline_items:
             dests.append(outline_item.dest)
-        # Assigning the .page_ref property of all Destination objects:
+        # Assigning the .page_ref property of all Destination objects,
+        # formatting each page reference only once:
+        page_refs = [pdf_ref(page_obj.id) for page_obj in page_objs]
         for dest in dests:
-            dest.page_ref = pdf_ref(page_objs[dest.page_number - 1].id)
+            dest.page_ref = page_refs[dest.page_number - 1]
         for struct_elem in fpdf.struct_builder.doc_struct_elem.k:
             struct_elem.pg = page_objs[struct_elem.page_number() - 1]
         xref.catalog_obj = catalog_obj
@@ -443,11 +454,13 @@ class OutputProducer:
                 trace_label = self.trace_labels_per_obj_id.get(pdf_obj.id)
             if trace_label:
                 with self._trace_size(trace_label):
-                    self._out(
+                    self._out_serialized(
                         pdf_obj.serialize(_security_handler=fpdf._security_handler)
                     )
             else:
-                self._out(pdf_obj.serialize(_security_handler=fpdf._security_handler))
+                self._out_serialized(
+                    pdf_obj.serialize(_security_handler=fpdf._security_handler)
+                )
         self._log_final_sections_sizes()
 
         if fpdf._sign_key:
@@ -468,7 +481,15 @@ class OutputProducer:
             if not isinstance(data, str):
                 data = str(data)
             data = data.encode("latin1")
-        self.buffer += data + b"\n"
+        # Two in-place extensions of the buffer, to avoid allocating data + b"\n":
+        self.buffer += data
+        self.buffer += b"\n"
+
+    def _out_serialized(self, data):
+        "Append the str or bytes returned by a PDF object .serialize() to the buffer"
+        # Lighter than ._out(), as this is called once per PDF object:
+        self.buffer += data.encode("latin1") if isinstance(data, str) else data
+        self.buffer += b"\n"
 
     def _add_pdf_obj(self, pdf_obj, trace_label=None):
         self.obj_id += 1
@@ -490,21 +511,36 @@ class OutputProducer:
     def _add_pages(self, _slice=slice(0, None)):
         fpdf = self.fpdf
         page_objs = []
-        for page_obj in list(fpdf.pages.values())[_slice]:
+        pages = list(fpdf.pages.values())[_slice]
+        compressed_contents = (
+            _compress_streams(
+                [page_obj.contents for page_obj in pages], fpdf.compression_level
+            )
+            if fpdf.compress
+            else None
+        )
+        # Pages often share the same format, so their /MediaBox is formatted only once:
+        media_boxes = {}
+        for i, page_obj in enumerate(pages):
             if fpdf.pdf_version > "1.3":
-                page_obj.group = pdf_dict(
-                    {"/Type": "/Group", "/S": "/Transparency", "/CS": "/DeviceRGB"},
-                    field_join=" ",
-                )
-            if page_obj.dimensions() != fpdf.default_page_dimensions:
-                page_obj.media_box = _dimensions_to_mediabox(page_obj.dimensions())
+                page_obj.group = PAGE_TRANSPARENCY_GROUP
+            dimensions = page_obj.dimensions()
+            if dimensions != fpdf.default_page_dimensions:
+                media_box = media_boxes.get(dimensions)
+                if media_box is None:
+                    media_box = media_boxes[dimensions] = _dimensions_to_mediabox(
+                        dimensions
+                    )
+                page_obj.media_box = media_box
             self._add_pdf_obj(page_obj, "pages")
             page_objs.append(page_obj)
 
             # Extracting the page contents to insert it as a content stream:
-            cs_obj = PDFContentStream(
-                contents=page_obj.contents, compress=fpdf.compress
-            )
+            if compressed_contents is not None:
+                cs_obj = PDFContentStream(contents=compressed_contents[i])
+                cs_obj.filter = Name("FlateDecode")
+            else:
+                cs_obj = PDFContentStream(contents=page_obj.contents)
             self._add_pdf_obj(cs_obj, "pages")
             page_obj.contents = cs_obj
         return page_objs
@@ -669,15 +705,13 @@ class OutputProducer:
 
                 # Embed CIDToGIDMap
                 # A specification of the mapping from CIDs to glyph indices
-                cid_to_gid_map = ["\x00"] * 256 * 256 * 2
+                # (one big-endian 16-bits glyph ID per CID, written in place)
+                cid_to_gid_map = bytearray(256 * 256 * 2)
                 for cc, glyph in code_to_glyph.items():
-                    cid_to_gid_map[cc * 2] = chr(glyph >> 8)
-                    cid_to_gid_map[cc * 2 + 1] = chr(glyph & 0xFF)
-                cid_to_gid_map = "".join(cid_to_gid_map)
+                    pack_into(">H", cid_to_gid_map, cc * 2, glyph)
 
-                # manage binary data as latin1 until PEP461-like function is implemented
                 cid_to_gid_map_obj = PDFContentStream(
-                    contents=cid_to_gid_map.encode("latin1"), compress=True
+                    contents=cid_to_gid_map, compress=True
                 )
                 self._add_pdf_obj(cid_to_gid_map_obj, "fonts")
                 cid_font_obj.c_i_d_to_g_i_d_map = cid_to_gid_map_obj
@@ -769,10 +803,15 @@ class OutputProducer:
 
         # Palette
         if "/Indexed" in color_space:
-            pal_cs_obj = PDFContentStream(
-                contents=info["pal"], compress=self.fpdf.compress
-            )
-            self._add_pdf_obj(pal_cs_obj, "images")
+            # Images sharing the same palette reference a single stream object:
+            pal_key = bytes(info["pal"])
+            pal_cs_obj = self.pal_obj_per_content.get(pal_key)
+            if pal_cs_obj is None:
+                pal_cs_obj = PDFContentStream(
+                    contents=info["pal"], compress=self.fpdf.compress
+                )
+                self._add_pdf_obj(pal_cs_obj, "images")
+                self.pal_obj_per_content[pal_key] = pal_cs_obj
             img_obj.color_space.append(pdf_ref(pal_cs_obj.id))
 
         return img_obj
@@ -797,20 +836,33 @@ class OutputProducer:
             for page_obj in page_objs:
                 page_obj.resources = resources_dict_obj
         else:
+            fonts_used_per_page_number = self.fpdf.fonts_used_per_page_number
+            images_used_per_page_number = self.fpdf.images_used_per_page_number
+            graphics_style_names_per_page_number = (
+                self.fpdf.graphics_style_names_per_page_number
+            )
+            gfx_names_order = {
+                gfx_name: order for order, gfx_name in enumerate(gfxstate_objs_per_name)
+            }
             for page_number, page_obj in enumerate(page_objs, start=1):
                 page_font_objs_per_index = {
                     font_id: font_objs_per_index[font_id]
-                    for font_id in self.fpdf.fonts_used_per_page_number[page_number]
+                    for font_id in fonts_used_per_page_number[page_number]
                 }
                 page_img_objs_per_index = {
                     img_id: img_objs_per_index[img_id]
-                    for img_id in self.fpdf.images_used_per_page_number[page_number]
+                    for img_id in images_used_per_page_number[page_number]
                 }
+                # Only the few graphics states used on this page are looked up,
+                # instead of scanning all of the document graphics states for every page:
+                page_gfx_names = sorted(
+                    graphics_style_names_per_page_number[page_number]
+                    & gfxstate_objs_per_name.keys(),
+                    key=gfx_names_order.__getitem__,
+                )
                 page_gfxstate_objs_per_name = {
-                    gfx_name: gfx_state
-                    for (gfx_name, gfx_state) in gfxstate_objs_per_name.items()
-                    if gfx_name
-                    in self.fpdf.graphics_style_names_per_page_number[page_number]
+                    gfx_name: gfxstate_objs_per_name[gfx_name]
+                    for gfx_name in page_gfx_names
                 }
                 page_obj.resources = self._add_resources_dict(
                     page_font_objs_per_index,
@@ -1014,6 +1066,22 @@ def stream_content_for_raster_image(
     )
 
 
+# Total size of the streams above which _compress_streams() uses several threads:
+_PARALLEL_COMPRESSION_MIN_BYTES = 1024 * 1024
+
+
+def _compress_streams(streams, level):
+    """
+    Compress several independent streams, in parallel if there is enough data:
+    zlib releases the GIL while compressing, so the work can use several CPU cores.
+    For small documents, starting the threads costs more than it saves.
+    """
+    if len(streams) < 2 or sum(map(len, streams)) < _PARALLEL_COMPRESSION_MIN_BYTES:
+        return [zlib.compress(stream, level=level) for stream in streams]
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(partial(zlib.compress, level=level), streams))
+
+
 def _tt_font_widths(font):
     rangeid = 0
     range_ = {}
@@ -1084,7 +1152,7 @@ def _tt_font_widths(font):
 
 def _dimensions_to_mediabox(dimensions):
     width_pt, height_pt = dimensions
-    return f"[0 0 {width_pt:.2f} {height_pt:.2f}]"
+    return "[0 0 %.2f %.2f]" % (width_pt, height_pt)
 
 
 def _sizeof_fmt(num, suffix="B"):
@@ -913,24 +913,27 @@ class SVGObject:
         ]:
             self.handle_defs(child)
 
+        items = []
         for child in group:
             if child.tag in xmlns_lookup("svg", "defs"):
                 self.handle_defs(child)
             elif child.tag in xmlns_lookup("svg", "g"):
-                pdf_group.add_item(self.build_group(child))
+                items.append(self.build_group(child))
             elif child.tag in xmlns_lookup("svg", "path"):
-                pdf_group.add_item(self.build_path(child))
+                items.append(self.build_path(child))
             elif child.tag in shape_tags:
-                pdf_group.add_item(self.build_shape(child))
+                items.append(self.build_shape(child))
             elif child.tag in xmlns_lookup("svg", "use"):
-                pdf_group.add_item(self.build_xref(child))
+                items.append(self.build_xref(child))
             elif child.tag in xmlns_lookup("svg", "image"):
-                pdf_group.add_item(self.build_image(child))
+                items.append(self.build_image(child))
             else:
                 LOGGER.warning(
                     "Ignoring unsupported SVG tag: <%s> (contributions are welcome to add support for it)",
                     without_ns(child.tag),
                 )
+        # the items have just been built for this group, so they do not need copying:
+        pdf_group.add_items(items, _copy=False)
 
         self.update_xref(group.attrib.get("id"), pdf_group)
 
@@ -65,6 +65,7 @@ from abc import ABC
 from binascii import hexlify
 from codecs import BOM_UTF16_BE
 from datetime import datetime, timezone
+from functools import lru_cache
 
 
 def clear_empty_fields(d):
@@ -165,15 +166,26 @@ class PDFObject:
         return iobj_ref(self.id)
 
     def serialize(self, obj_dict=None, _security_handler=None):
-        "Serialize the PDF object as an obj<</>>endobj text block"
-        output = []
-        output.append(f"{self.id} 0 obj")
-        output.append("<<")
+        """
+        Serialize the PDF object as an obj<</>>endobj text block.
+        When the object has a binary content stream, `bytes` are returned instead,
+        so that the stream is not decoded & re-encoded as latin-1.
+        """
+        output = [f"{self.id} 0 obj", "<<"]
         if not obj_dict:
             obj_dict = self._build_obj_dict(_security_handler)
         output.append(create_dictionary_string(obj_dict, open_dict="", close_dict=""))
         output.append(">>")
         content_stream = self.content_stream()
+        if content_stream and isinstance(content_stream, (bytearray, bytes)):
+            output.append("stream\n")
+            return b"".join(
+                (
+                    "\n".join(output).encode("latin-1"),
+                    content_stream,
+                    b"\nendstream\nendobj",
+                )
+            )
         if content_stream:
             output.append(create_stream(content_stream))
         output.append("endobj")
@@ -192,7 +204,13 @@ class PDFObject:
         and prefixed with a slash character "/".
         """
         return build_obj_dict(
-            {key: getattr(self, key) for key in dir(self)},
+            {
+                key: getattr(self, key)
+                for key in dir(self)
+                # private attributes & the .id / .ref properties are never serialized,
+                # so there is no point in evaluating them:
+                if not key.startswith("_") and key not in ("id", "ref")
+            },
             _security_handler=security_handler,
             _obj_id=self.id,
         )
@@ -254,7 +272,7 @@ def build_obj_dict(key_values, _security_handler=None, _obj_id=None):
             )
         elif isinstance(value, bool):
             value = str(value).lower()
-        obj_dict[f"/{camel_case(key)}"] = value
+        obj_dict[pdf_key(key)] = value
     return obj_dict
 
 
@@ -262,6 +280,15 @@ def camel_case(snake_case):
     return "".join(x for x in snake_case.title() if x != "_")
 
 
+@lru_cache(maxsize=None)
+def pdf_key(attr_name):
+    """
+    Convert a Python attribute name into a PDF dictionary key, e.g. media_box -> /MediaBox.
+    Results are cached, as the same few attribute names are used by all PDF objects.
+    """
+    return f"/{camel_case(attr_name)}"
+
+
 class PDFString(str):
     USE_HEX_ENCODING = True
     """
@@ -66,6 +66,8 @@ numbers = (
     pytest.param(10.00001, "10", id="truncated float"),
     pytest.param(-1.12345, "-1.1235", id="rounded float"),
     pytest.param(-0.00004, "-0", id="negative zero"),
+    pytest.param(-0.0, "0", id="exact negative zero"),
+    pytest.param(2.5, "2.5", id="trailing zeros"),
 )
 
 r = fpdf.drawing.Raw
@@ -365,6 +365,33 @@ class TestTransform:
         with pytest.raises(TypeError):
             _ = tf1 @ 123
 
+    def test_specialized_matmul(self):
+        T = fpdf.drawing.Transform
+        tf = T(1, 2, 3, 4, 5, 6)
+        specialized = (T.identity(), T.translation(7, -8), T.scaling(2, 3))
+
+        for lhs in specialized:
+            for rhs in (*specialized, tf):
+                generic = T(*lhs) @ T(*rhs)
+                assert lhs @ rhs == generic
+                assert tuple(lhs @ rhs @ tf) == tuple(generic @ tf)
+
+        assert T.translation(1, 2).rotation(0.5) == T.rotation(0.5)
+        assert type(T.translation(1, 2).rotation(0.5)) is T
+        assert copy.deepcopy(T.scaling(2)) == T(2, 0, 0, 2, 0, 0)
+
+    def test_specialized_replace_and_make(self):
+        T = fpdf.drawing.Transform
+
+        assert T.scaling(2)._replace(e=10) @ T.translation(1, 1) == T(2, 0, 0, 2, 11, 1)
+        assert T.translation(1, 1)._replace(a=3) @ T.scaling(2) == T(6, 0, 0, 2, 2, 2)
+        assert T.identity()._replace(f=4) @ T.translation(1, 1) == T(1, 0, 0, 1, 1, 5)
+        for tf in (T.identity(), T.translation(7, -8), T.scaling(2, 3)):
+            assert type(tf._replace()) is T
+            assert type(tf._make(tuple(tf))) is T
+            assert repr(tf) == repr(T(*tf))
+            assert repr(tf).startswith("Transform(")
+
     def test_render(self):
         tf = fpdf.drawing.Transform(1, 2, 3, 4, 5, 6)
 
@@ -622,6 +649,26 @@ class TestDrawingContext:
             "     └─ ImplicitClose() resolved to h\n"
         )
 
+    def test_render_debug_multiple_items(self, auto_pdf):
+        dbg = io.StringIO()
+
+        with auto_pdf.drawing_context(debug_stream=dbg) as ctx:
+            ctx.add_item(fpdf.drawing.PaintedPath().line_to(10, 10))
+            ctx.add_item(fpdf.drawing.PaintedPath().line_to(20, 20))
+
+        tree = dbg.getvalue()
+        assert tree.startswith("ROOT\n ├─ GraphicsContext {\n")
+        assert "\n │   ├─ Line(pt=Point(x=10, y=10))\n" in tree
+        assert "\n └─ GraphicsContext {\n" in tree
+        assert tree.endswith("     └─ ImplicitClose() resolved to h\n")
+
+    def test_empty_drawing_context(self, auto_pdf):
+        contents = auto_pdf.pages[auto_pdf.page].contents
+        initial_length = len(contents)
+        with auto_pdf.drawing_context() as ctx:
+            ctx.add_item(fpdf.drawing.GraphicsContext())
+        assert len(contents) == initial_length
+
     def test_concurrent_drawing_context(self, auto_pdf):
         with auto_pdf.drawing_context() as _:
             with pytest.raises(fpdf.FPDFException):
@@ -656,6 +703,25 @@ class CommonPathTests:
         assert pth._starter_move == fpdf.drawing.Move(fpdf.drawing.Point(2, 2))
         assert pth._graphics_context.path_items[-1] == fpdf.drawing.ImplicitClose()
 
+    def test_move_relative_without_drawing(self):
+        pth = self.path_class()
+
+        pth.move_to(1, 1)
+        pth.move_relative(2, 2)
+        pth.line_to(5, 5)
+        pth.close()
+        pth.move_relative(1, 0)
+        pth.move_relative(0, 1)
+        pth.line_relative(1, 1)
+
+        assert pth._graphics_context.path_items == [
+            fpdf.drawing.Move(fpdf.drawing.Point(3, 3)),
+            fpdf.drawing.Line(fpdf.drawing.Point(5, 5)),
+            fpdf.drawing.Close(),
+            fpdf.drawing.RelativeMove(fpdf.drawing.Point(1, 1)),
+            fpdf.drawing.RelativeLine(fpdf.drawing.Point(1, 1)),
+        ]
+
     def test_style_property(self):
         pth = self.path_class()
         pth.style.fill_color = "#010203"
@@ -839,8 +905,8 @@ class TestGraphicsContext:
         assert rend1 == rend2 == rend3
         assert rend3 != rend4
 
-        assert rend1 == "q 1 2 m Q"
-        assert rend4 == "q 1 2 m 3 4 l Q"
+        assert rend1 == "1 2 m"
+        assert rend4 == "1 2 m 3 4 l"
 
     def test_transform_property(self):
         gfx = fpdf.drawing.GraphicsContext()
@@ -900,6 +966,21 @@ class TestGraphicsContext:
 
         assert gfx.path_items == [fpdf.drawing.Move(fpdf.drawing.Point(10, 0))]
 
+    def test_add_items(self):
+        gfx = fpdf.drawing.GraphicsContext()
+        line = fpdf.drawing.Line(fpdf.drawing.Point(2, 2))
+        child = fpdf.drawing.GraphicsContext()
+        gfx.add_items([fpdf.drawing.Move(fpdf.drawing.Point(10, 0)), line, child])
+
+        assert gfx.path_items[:2] == [
+            fpdf.drawing.Move(fpdf.drawing.Point(10, 0)),
+            line,
+        ]
+        assert gfx.path_items[2] is not child
+
+        gfx.add_items((child,), _copy=False)
+        assert gfx.path_items[3] is child
+
     def test_merge(self):
         gfx1 = fpdf.drawing.GraphicsContext()
         gfx1.add_item(fpdf.drawing.Move(fpdf.drawing.Point(10, 0)))
@@ -948,11 +1029,16 @@ class TestGraphicsContext:
 
         rend1, _, __ = gfx.render(gsdr, style, start, point)
 
-        assert rend1 == "q 1 2 m 3 4 l Q"
+        assert rend1 == "1 2 m 3 4 l"
 
-        rend2, _, __ = gfx.render(gsdr, style, start, point, _push_stack=False)
+        gfx.style.fill_color = "#ff0000"
+        rend2, _, __ = gfx.render(gsdr, style, start, point)
 
-        assert rend2 == "1 2 m 3 4 l"
+        assert rend2 == "q 1 0 0 rg 1 2 m 3 4 l Q"
+
+        rend3, _, __ = gfx.render(gsdr, style, start, point, _push_stack=False)
+
+        assert rend3 == "1 0 0 rg 1 2 m 3 4 l"
 
     def test_render_debug(self):
         point = fpdf.drawing.Point(0, 0)
@@ -968,7 +1054,7 @@ class TestGraphicsContext:
 
         rend1, _, __ = gfx.render_debug(gsdr, style, start, point, dbg, "")
 
-        assert rend1 == "q 1 2 m 3 4 l Q"
+        assert rend1 == "1 2 m 3 4 l"
 
         rend2, _, __ = gfx.render_debug(
             gsdr, style, start, point, dbg, "", _push_stack=False
@@ -976,6 +1062,30 @@ class TestGraphicsContext:
 
         assert rend2 == "1 2 m 3 4 l"
 
+    def test_inherited_colors_are_not_reemitted(self):
+        point = fpdf.drawing.Point(0, 0)
+        start = fpdf.drawing.Move(point)
+        gsdr = fpdf.drawing.GraphicsStateDictRegistry()
+        style = fpdf.drawing.GraphicsStyle()
+        style.paint_rule = "auto"
+
+        inner = fpdf.drawing.GraphicsContext()
+        inner.style.fill_color = "#ff0000"
+        inner.style.stroke_color = "#0000ff"
+        inner.add_item(fpdf.drawing.Line(fpdf.drawing.Point(3, 4)))
+
+        outer = fpdf.drawing.GraphicsContext()
+        outer.style.fill_color = "#ff0000"
+        outer.add_item(fpdf.drawing.Move(fpdf.drawing.Point(1, 2)))
+        outer.add_item(inner)
+        outer.add_item(copy.deepcopy(inner))
+
+        rend, _, __ = outer.render(gsdr, style, start, point)
+
+        assert rend == (
+            "q 1 0 0 rg 1 2 m q /GS0 gs 0 0 1 RG 3 4 l Q q /GS0 gs 0 0 1 RG 3 4 l Q Q"
+        )
+
 
 def test_check_page():
     pdf = fpdf.FPDF(unit="pt")
@@ -5,7 +5,8 @@ from pathlib import Path
 import pytest
 
 from fpdf import FPDF
-from fpdf.encryption import StandardSecurityHandler as sh
+from fpdf import encryption
+from fpdf.encryption import ARC4, StandardSecurityHandler as sh
 from fpdf.enums import AccessPermission, EncryptionMethod
 from fpdf.errors import FPDFException
 from test.conftest import assert_pdf_equal
@@ -53,6 +54,30 @@ def test_encryption_rc4(tmp_path):
     assert_pdf_equal(pdf, HERE / "encryption_rc4.pdf", tmp_path)
 
 
+def test_encryption_rc4_pure_python_fallback(tmp_path, monkeypatch):
+    key, text = b"\x01\x02\x03\x04\x05", b"string to be encrypted"
+    expected = ARC4().encrypt(key, text)
+    monkeypatch.setattr(encryption, "ARC4Algorithm", None)
+    assert ARC4().encrypt(key, text) == expected
+    test_encryption_rc4(tmp_path)
+
+
+def test_encryption_rc4_unsupported_by_openssl(tmp_path, monkeypatch):
+    # cryptography is installed, but OpenSSL does not provide RC4
+    # (e.g. legacy provider unavailable, or FIPS mode):
+    UnsupportedAlgorithm = pytest.importorskip(
+        "cryptography.exceptions"
+    ).UnsupportedAlgorithm
+
+    def unsupported_cipher(*_, **__):
+        raise UnsupportedAlgorithm("RC4 is not supported by this OpenSSL build")
+
+    monkeypatch.setattr(encryption, "Cipher", unsupported_cipher)
+    assert encryption._load_arc4_algorithm() is None
+    monkeypatch.setattr(encryption, "ARC4Algorithm", encryption._load_arc4_algorithm())
+    test_encryption_rc4(tmp_path)
+
+
 def test_encryption_rc4_permissions(tmp_path):
     pdf = FPDF()
     pdf.set_author("author")
@@ -257,6 +282,18 @@ def test_encryption_aes256_with_user_password(tmp_path):
     assert_pdf_equal(pdf, HERE / "encryption_aes256_user_password.pdf", tmp_path)
 
 
+def test_object_keys_are_cached():
+    pdf = FPDF()
+    pdf.set_encryption(owner_password="fpdf2")
+    handler = pdf._security_handler
+    handler.generate_passwords(pdf._default_file_id(bytearray(0x00)))
+    key = handler.get_object_key(3)
+    assert handler.get_object_key(3) is key
+    assert handler.get_object_key(4) != key
+    # RC4 encryption of different strings of the same object must not share a keystream state:
+    assert handler.encrypt_bytes(b"abc", 3) == handler.encrypt_bytes(b"abc", 3)
+
+
 def test_blank_owner_password():
     pdf = FPDF()
     pdf.set_encryption(
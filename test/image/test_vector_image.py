@@ -171,6 +171,27 @@ def test_svg_image_from_bytes(tmp_path):
     assert_pdf_equal(pdf, HERE / "svg_image_from_bytesio.pdf", tmp_path)
 
 
+def test_svg_image_parsed_once(tmp_path):
+    svg_bytes = (SVG_SRCDIR / "SVG_logo.svg").read_bytes()
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    # The parsed SVG is shared by those insertions, with different sizes & positions:
+    pdf.image(SVG_SRCDIR / "SVG_logo.svg", w=50)
+    pdf.image(svg_bytes, x=70, y=20, w=60, h=30)
+    pdf.image(BytesIO(svg_bytes), x=70, y=60, w=60, h=30, keep_aspect_ratio=True)
+    pdf.image(svg_bytes, x="C", y=100, h=40)
+    # This image has no viewbox and width=100 and height=200:
+    no_viewbox_bytes = (SVG_SRCDIR / "simple_rect_no_viewbox.svg").read_bytes()
+    with pytest.warns(UserWarning, match='no "viewBox"') as record:
+        pdf.image(no_viewbox_bytes, x=10, y=150, w=30)
+        pdf.image(no_viewbox_bytes, x=50, y=150, w=60, h=60, keep_aspect_ratio=True)
+        pdf.image(no_viewbox_bytes, x=120, y=150, h=40)
+    # The warning is only emitted once per identical SVG document:
+    assert len(record) == 1
+    assert len(pdf.image_cache.vector_images) == 2
+    assert_pdf_equal(pdf, HERE / "svg_image_parsed_once.pdf", tmp_path)
+
+
 def test_svg_image_billion_laughs():
     "cf. https://pypi.org/project/defusedxml/#attack-vectors"
     pdf = fpdf.FPDF()
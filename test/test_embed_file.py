@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from fpdf import FPDF
+from fpdf import FPDF, annotations
 
 from test.conftest import assert_pdf_equal, EPOCH
 import pytest
@@ -30,6 +30,12 @@ def test_embed_file_all_optionals(tmp_path):
     assert_pdf_equal(pdf, HERE / "embed_file_all_optionals.pdf", tmp_path)
 
 
+def test_embed_file_all_optionals_threaded_checksum(tmp_path, monkeypatch):
+    # Large files are hashed in a thread while being compressed:
+    monkeypatch.setattr(annotations, "_THREADED_CHECKSUM_MIN_BYTES", 0)
+    test_embed_file_all_optionals(tmp_path)
+
+
 def test_embed_file_from_bytes(tmp_path):
     pdf = FPDF()
     pdf.add_page()
@@ -393,3 +393,17 @@ def test_local_context_font_size_and_header_footer(tmp_path):  # issue 1204
     assert_pdf_equal(
         pdf, HERE / "local_context_font_size_and_header_footer.pdf", tmp_path
     )
+
+
+def test_font_face_reflects_settings_changes():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("helvetica", "B", 12)
+    font_face = pdf.font_face()
+    assert pdf.font_face() is font_face  # nothing changed
+    pdf.set_text_color(255, 0, 0)
+    assert pdf.font_face().color == drawing.DeviceRGB(1, 0, 0)
+    with pdf.local_context(font_size_pt=20):
+        assert pdf.font_face().size_pt == 20
+    pdf.set_text_color(0)
+    assert pdf.font_face() == font_face
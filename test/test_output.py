@@ -1,3 +1,4 @@
+import zlib
 from filecmp import cmp
 
 import fpdf
@@ -22,3 +23,29 @@ def test_deprecation_warning(tmp_path):
 def test_save_to_absolute_path(tmp_path):
     pdf = fpdf.FPDF()
     pdf.output((tmp_path / "empty.pdf").absolute())
+
+
+def test_compression_level():
+    sizes = {}
+    for level in (0, 9):
+        pdf = fpdf.FPDF()
+        pdf.set_compression(True, level=level)
+        pdf.add_page()
+        pdf.set_font("helvetica")
+        pdf.multi_cell(w=0, text="Lorem ipsum dolor sit amet. " * 200)
+        assert pdf.compression_level == level
+        sizes[level] = len(pdf.output())
+    assert sizes[9] < sizes[0]
+
+
+def test_compressed_pages_content(tmp_path):
+    pdf = fpdf.FPDF()
+    pdf.set_font("helvetica")
+    for i in range(3):
+        pdf.add_page()
+        pdf.cell(text=f"Page {i + 1}")
+    contents = [bytes(page.contents) for page in pdf.pages.values()]
+    pdf.output(tmp_path / "compressed.pdf")
+    assert [
+        zlib.decompress(page.contents.content_stream()) for page in pdf.pages.values()
+    ] == contents
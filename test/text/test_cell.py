@@ -325,6 +325,17 @@ def test_cell_deprecated_txt_arg():
         pdf.cell(txt="Lorem ipsum Ut nostrud irure")
 
 
+def test_cell_fill_without_area():
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Helvetica", size=TEXT_SIZE)
+    pdf.set_fill_color(255, 0, 0)
+    pdf.cell(w=10, h=0, fill=True)
+    pdf.cell(w=10, h=0, fill=True, border=1)
+    assert pdf.pages[1].contents.count(b" re f") == 0
+    assert pdf.pages[1].contents.count(b" re B") == 1
+
+
 @ensure_exec_time_below(seconds=18)
 @ensure_rss_memory_below(mib=1)
 def test_cell_speed_with_long_text():  # issue #907